@@ -96,12 +96,9 @@ CALLABLE_RESOURCE_TYPES = [
 # We collect gpu every GPU_COLLECTION_INTERVAL.
 # Meaning that in one minute we collect (MINUTE / GPU_COLLECTION_INTERVAL) gpu stats.
 # Currently, we save gpu info of the last 10 minutes or less.
-MAX_GPU_INFO_LEN = (MINUTE / GPU_COLLECTION_INTERVAL) * 10
-
 # If we just collect the gpu stats (and not send them to den), the gpu_info dictionary *will not* be reseted by the servlets.
-# Therefore, we need to cut the gpu_info size, so it doesn't consume too much cluster memory.
-# Currently, we reduce the size by half, meaning we only keep the gpu_info of the last (MAX_GPU_INFO_LEN / 2) minutes.
-REDUCED_GPU_INFO_LEN = MAX_GPU_INFO_LEN / 2
+# Therefore, each gpu's samples are kept in a ring buffer of this size, so it doesn't consume too much cluster memory.
+MAX_GPU_INFO_LEN = (MINUTE // GPU_COLLECTION_INTERVAL) * 10
 
 DEFAULT_LOG_LEVEL = "INFO"
 # Surfacing Logs to Den constants
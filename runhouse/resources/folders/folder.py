@@ -1,10 +1,11 @@
-import copy
+import functools
 import os
 import pickle
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from runhouse.globals import rns_client
 from runhouse.logger import get_logger
@@ -17,12 +18,27 @@ from runhouse.utils import locate_working_dir
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=16)
+def _rh_workdir(cwd: str):
+    # Searching up from the cwd for the project root stats several marker files per directory level, which
+    # dominated constructing a Folder from a relative path. The project root doesn't move within a process.
+    return locate_working_dir(cwd)
+
+
+@functools.lru_cache(maxsize=1024)
+def _expand_local_path(path: str) -> str:
+    # Folder.path is read by nearly every method, so avoid building and expanding a Path on every access.
+    return str(Path(path).expanduser())
+
+
 class Folder(Resource):
     RESOURCE_TYPE = "folder"
     DEFAULT_FS = "file"
     CLUSTER_FS = "ssh"
     DEFAULT_FOLDER_PATH = "/runhouse-folder"
     DEFAULT_CACHE_FOLDER = "~/.cache/runhouse"
+    # Max number of objects transferred at once when copying to or from a blob store
+    MAX_CONCURRENT_TRANSFERS = 32
 
     def __init__(
         self,
@@ -63,6 +79,15 @@ class Folder(Resource):
         state["_urlpath"] = None
         return state
 
+    def _clone(self, path: str, system: Union[str, Cluster]):
+        """Copy of the folder at a new path and system. The remaining attributes are immutable values, so a
+        shallow copy avoids deep copying the source system (e.g. a cluster and its http client)."""
+        new_folder = object.__new__(type(self))
+        new_folder.__dict__ = self.__dict__.copy()
+        new_folder.path = path
+        new_folder.system = system
+        return new_folder
+
     @classmethod
     def default_path(cls, rns_address, system):
         name = (
@@ -111,7 +136,7 @@ class Folder(Resource):
         """Folder path."""
         if self._path is not None:
             if self.system == Folder.DEFAULT_FS:
-                return str(Path(self._path).expanduser())
+                return _expand_local_path(self._path)
             return str(self._path)
         else:
             return None
@@ -337,14 +362,14 @@ class Folder(Resource):
         dest_path = path or f"~/{Path(self.path).name}"
 
         # Need to add slash for rsync to copy the contents of the folder
-        dest_folder = copy.deepcopy(self)
-        dest_folder.path = dest_path
-        dest_folder.system = dest_cluster
+        dest_folder = self._clone(path=dest_path, system=dest_cluster)
 
         if self._fs_str == self.DEFAULT_FS and dest_cluster.name is not None:
             # Includes case where we're on the cluster itself
             # And the destination is a cluster, not rh.here
-            dest_cluster.rsync(source=self.path, dest=dest_path, up=True, contents=True)
+            dest_cluster.rsync(
+                source=self.path, dest=dest_path, up=True, contents=True, parallel=True
+            )
 
         elif isinstance(self.system, Resource):
             if self.system.endpoint(external=False) == dest_cluster.endpoint(
@@ -382,11 +407,14 @@ class Folder(Resource):
             creds_cmd = f"-i '{creds_file}' " if creds_file else ""
 
             dest_cluster.run_bash([f"mkdir -p {dest_path}"])
+            # -W: send whole files rather than computing deltas, since the destination tree is typically fresh.
+            # ControlPath is needed for ControlMaster to actually share the connection across invocations.
             command = (
-                f"rsync -Pavz --filter='dir-merge,- .gitignore' -e \"ssh {creds_cmd}"
+                f"rsync -PavzW --filter='dir-merge,- .gitignore' -e \"ssh {creds_cmd}"
                 f"-o StrictHostKeyChecking=no -o IdentitiesOnly=yes -o ExitOnForwardFailure=yes "
                 f"-o ServerAliveInterval=5 -o ServerAliveCountMax=3 -o ConnectTimeout=30s -o ForwardAgent=yes "
-                f'-o ControlMaster=auto -o ControlPersist=300s" {src_path}/ {dest_cluster.head_ip}:{dest_path}'
+                f'-o ControlMaster=auto -o ControlPath=/tmp/rh-ssh-%r@%h:%p -o ControlPersist=300s" '
+                f"{src_path}/ {dest_cluster.head_ip}:{dest_path}"
             )
             status_codes = self.system.run_bash([command])
             if status_codes[0][0] != 0:
@@ -413,10 +441,7 @@ class Folder(Resource):
             up=False,
             contents=True,
         )
-        new_folder = copy.deepcopy(self)
-        new_folder.path = dest_path
-        new_folder.system = self.DEFAULT_FS
-        return new_folder
+        return self._clone(path=dest_path, system=self.DEFAULT_FS)
 
     def is_local(self):
         """Whether the folder is on the local filesystem.
@@ -424,11 +449,10 @@ class Folder(Resource):
         Example:
             >>> is_local = my_folder.is_local()
         """
-        return (
-            self._fs_str == self.DEFAULT_FS
-            and self.path is not None
-            and Path(self.path).expanduser().exists()
-        )
+        if self._fs_str != self.DEFAULT_FS:
+            return False
+        path = self.path
+        return path is not None and os.path.exists(os.path.expanduser(path))
 
     def _upload(self, src: str, region: Optional[str] = None):
         """Upload a folder to a remote folder."""
@@ -502,7 +526,7 @@ class Folder(Resource):
         return (
             path
             if Path(path).expanduser().is_absolute()
-            else str(Path(locate_working_dir()) / path)
+            else str(Path(_rh_workdir(os.getcwd())) / path)
         )
 
     @staticmethod
@@ -554,17 +578,25 @@ class Folder(Resource):
             return self.system._folder_ls(self.path, full_paths=full_paths, sort=sort)
         else:
             path = Path(self.path).expanduser()
-            paths = [p for p in path.iterdir()]
+            with os.scandir(path) as it:
+                entries = list(it)
 
             # Sort the paths by modification time if sort is True
             if sort:
-                paths.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+                entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
 
             # Convert paths to strings and format them based on full_paths
             if full_paths:
-                return [str(p.resolve()) for p in paths]
+                # Resolve the folder once, and only resolve entries individually if they're symlinks
+                resolved_path = path.resolve()
+                return [
+                    str(Path(entry.path).resolve())
+                    if entry.is_symlink()
+                    else str(resolved_path / entry.name)
+                    for entry in entries
+                ]
             else:
-                return [p.name for p in paths]
+                return [entry.name for entry in entries]
 
     def resources(self, full_paths: bool = False):
         """List the resources in the folder.
@@ -579,16 +611,20 @@ class Folder(Resource):
 
             if self._use_http_endpoint:
                 paths = self.system._folder_ls(path=self.path, full_paths=full_paths)
-                resources = [
-                    path
-                    for path in paths
-                    if self.system._folder_exists(path=f"{path}/config.json")
-                ]
+                # Each existence check is a round trip to the cluster, so issue them concurrently
+                has_config = self._run_concurrently(
+                    lambda path: self.system._folder_exists(path=f"{path}/config.json"),
+                    paths,
+                )
+                resources = [path for path, exists in zip(paths, has_config) if exists]
                 return resources
             else:
-                resources = [
-                    path for path in self.ls() if (Path(path) / "config.json").exists()
-                ]
+                with os.scandir(Path(self.path).expanduser()) as entries:
+                    resources = [
+                        entry.name
+                        for entry in entries
+                        if os.path.exists(os.path.join(entry.path, "config.json"))
+                    ]
                 if full_paths:
                     return [
                         self.rns_address + "/" + Path(path).stem for path in resources
@@ -611,29 +647,25 @@ class Folder(Resource):
         if self._rns_folder:
             return str(Path(self._rns_folder) / self.name)
 
-        if self.path in rns_client.rns_base_folders.values():
-            if self._rns_folder:
-                return self._rns_folder + "/" + self.name
-            else:
-                return rns_client.default_folder + "/" + self.name
+        base_folder_paths = rns_client.rns_base_folder_paths
+        if self.path in base_folder_paths:
+            return rns_client.default_folder + "/" + self.name
 
+        # Walk up to the nearest registered base folder, and resolve relative to its rns path
+        home = Path.home()
         segment = Path(self.path)
         while (
-            str(segment) not in rns_client.rns_base_folders.values()
-            and not segment == Path.home()
+            str(segment) not in base_folder_paths
+            and not segment == home
             and not segment == segment.parent
         ):
             segment = segment.parent
 
-        if (
-            segment == Path.home() or segment == segment.parent
-        ):  # TODO throw an error instead?
+        if segment == home or segment == segment.parent:  # TODO throw an error instead?
             return rns_client.default_folder + "/" + self.name
         else:
-            base_folder = Folder(path=str(segment), dryrun=True)
-            base_folder_path = base_folder.rns_address
-            relative_path = str(Path(self.path).relative_to(base_folder.path))
-            return base_folder_path + "/" + relative_path
+            relative_path = str(Path(self.path).relative_to(segment))
+            return base_folder_paths[str(segment)] + "/" + relative_path
 
     def contains(self, name_or_path: str) -> bool:
         """Whether path exists locally inside a folder.
@@ -690,19 +722,15 @@ class Folder(Resource):
                 None,
             )  # If only a single element, would have been found in ls above.
 
-        # Look for lowest folder in the path that exists in filesystem, and recurse from that folder
+        # Walk down the segments for as long as they exist in the filesystem. A missing segment means nothing
+        # below it can exist either, so there's no need to search from a sub-folder.
         greatest_common_folder = Path(self.path)
-        i = 0
-        for i, seg in enumerate(segments):
+        for seg in segments:
             if not (greatest_common_folder / seg).exists():
-                break
+                return None, None
             greatest_common_folder = greatest_common_folder / seg
-        if not str(greatest_common_folder) == self.path:
-            return Folder(
-                path=str(greatest_common_folder), system=self.system, dryrun=True
-            ).locate("/".join(segments[i + 1 :]))
 
-        return None, None
+        return str(greatest_common_folder), self.system
 
     def open(self, name, mode: str = "rb", encoding: Optional[str] = None):
         """Returns the specified file as a stream (`botocore.response.StreamingBody`), which must be used as a
@@ -837,8 +865,11 @@ class Folder(Resource):
 
             if overwrite is False:
                 # Check if files exist and raise an error if they do
-                existing_files = set(os.listdir(full_path))
-                intersection = existing_files.intersection(set(contents.keys()))
+                intersection = {
+                    filename
+                    for filename in contents
+                    if os.path.exists(os.path.join(full_path, filename))
+                }
                 if intersection:
                     raise FileExistsError(
                         f"File(s) {intersection} already exist(s) at path: {full_path}. "
@@ -848,8 +879,6 @@ class Folder(Resource):
             for filename, file_obj in contents.items():
                 file_obj = self._serialize_file_obj(file_obj)
                 file_path = Path(full_path) / filename
-                if not overwrite and file_path.exists():
-                    raise FileExistsError(f"File {file_path} already exists.")
 
                 try:
                     with open(file_path, mode) as f:
@@ -860,6 +889,19 @@ class Folder(Resource):
                         f"Failed to write {filename} to {file_path}: {e}"
                     )
 
+    @classmethod
+    def _run_concurrently(cls, fn: Callable, items: Iterable) -> List:
+        """Apply ``fn`` to each item using a thread pool, returning the results in order and raising the
+        first error encountered."""
+        items = list(items)
+        if not items:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(cls.MAX_CONCURRENT_TRANSFERS, len(items))
+        ) as executor:
+            futures = [executor.submit(fn, item) for item in items]
+            return [future.result() for future in futures]
+
     @staticmethod
     def _serialize_file_obj(file_obj):
         if not isinstance(file_obj, bytes):
@@ -1,6 +1,7 @@
-import copy
+import functools
 import shutil
 import subprocess
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -11,13 +12,40 @@ from .folder import Folder
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _base_gcs_client():
+    """GCS client shared across folders, since building one resolves credentials and the default project."""
+    from google.cloud import storage
+
+    return storage.Client()
+
+
+_gcs_clients = threading.local()
+
+
+def _gcs_client():
+    """GCS client for the current thread. Clients aren't documented as thread-safe, so each thread (e.g. the workers
+    of ``_run_concurrently``) gets its own, reusing the credentials and project already resolved for the base
+    client."""
+    client = getattr(_gcs_clients, "client", None)
+    if client is None:
+        from google.cloud import storage
+
+        base_client = _base_gcs_client()
+        client = storage.Client(
+            project=base_client.project, credentials=base_client._credentials
+        )
+        _gcs_clients.client = client
+    return client
+
+
 class GCSFolder(Folder):
     RESOURCE_TYPE = "folder"
     DEFAULT_FS = "gcp"
 
     def __init__(self, dryrun: bool, **kwargs):
         try:
-            from google.cloud import storage
+            from google.cloud import storage  # noqa: F401
         except ImportError:
             raise ImportError(
                 "`google-cloud-storage` is required for GCS folders. "
@@ -25,9 +53,12 @@ class GCSFolder(Folder):
             )
 
         super().__init__(dryrun=dryrun, **kwargs)
-        self.client = storage.Client()
         self._urlpath = "gs://"
 
+    @property
+    def client(self):
+        return _gcs_client()
+
     @staticmethod
     def from_config(config: Dict, dryrun: bool = False, _resolve_children: bool = True):
         """Load config values into the object."""
@@ -50,15 +81,19 @@ class GCSFolder(Folder):
 
         return self._destination_folder(dest_path=dest_path, dest_system="file")
 
-    def _gcs_copy_to_local(self, dest_path: str):
+    def _gcs_copy_to_local(self, dest_path: str, blobs: Optional[List] = None):
         """Copy GCS folder to local."""
         Path(dest_path).mkdir(parents=True, exist_ok=True)
         key = self._key
-        blobs = self.client.list_blobs(self.bucket.name, prefix=key)
-        for blob in blobs:
+
+        def _download_blob(blob):
             dest_file_path = Path(dest_path) / Path(blob.name).relative_to(key)
             dest_file_path.parent.mkdir(parents=True, exist_ok=True)
-            blob.download_to_filename(str(dest_file_path))
+            blob.download_to_filename(str(dest_file_path), client=self.client)
+
+        if blobs is None:
+            blobs = self.client.list_blobs(self.bucket.name, prefix=key)
+        self._run_concurrently(_download_blob, blobs)
 
     def _cluster_to_local(self, cluster, dest_path):
         if not cluster.ips:
@@ -71,39 +106,41 @@ class GCSFolder(Folder):
             up=False,
             contents=True,
         )
-        new_folder = copy.deepcopy(self)
-        new_folder.path = dest_path
-        new_folder.system = "file"
-        return new_folder
+        return self._clone(path=dest_path, system="file")
 
     def _move_within_gcs(self, new_path):
         key = self._key
-        blobs = self.client.list_blobs(self.bucket.name, prefix=key)
-        for blob in blobs:
-            old_name = blob.name
-            new_name = new_path + old_name[len(key) :]
-            self.bucket.copy_blob(blob, self.bucket, new_name)
-            blob.delete()
+        bucket = self.bucket
+        blobs = list(self.client.list_blobs(bucket.name, prefix=key))
+
+        def _copy_blob(blob):
+            worker_bucket = self.bucket
+            worker_bucket.copy_blob(
+                blob, worker_bucket, new_path + blob.name[len(key) :]
+            )
+
+        self._run_concurrently(_copy_blob, blobs)
+        # Only delete the source blobs once all of them have been copied over
+        bucket.delete_blobs(blobs)
 
     def _gcs_to_local(self, local_path):
-        key = self._key
-        Path(local_path).mkdir(parents=True, exist_ok=True)
-        blobs = self.client.list_blobs(self.bucket.name, prefix=key)
-        for blob in blobs:
-            dest_file_path = Path(local_path) / Path(blob.name).relative_to(key)
-            dest_file_path.parent.mkdir(parents=True, exist_ok=True)
-            blob.download_to_filename(str(dest_file_path))
-            blob.delete()
+        blobs = list(self.client.list_blobs(self.bucket.name, prefix=self._key))
+        self._gcs_copy_to_local(local_path, blobs=blobs)
+        self.bucket.delete_blobs(blobs)
 
     def _gcs_copy(self, new_path):
         key = self._key
-        blobs = self.client.list_blobs(self.bucket.name, prefix=key)
-        for blob in blobs:
-            old_name = blob.name
-            new_name = new_path + old_name[len(key) :]
-            new_blob = self.bucket.blob(new_name)
+        bucket = self.bucket
+
+        def _copy_blob(blob):
+            # Server-side rewrite, the blob contents never leave GCS
+            new_blob = self.bucket.blob(new_path + blob.name[len(key) :])
             new_blob.rewrite(blob)
 
+        self._run_concurrently(
+            _copy_blob, self.client.list_blobs(bucket.name, prefix=key)
+        )
+
     def put(self, contents, overwrite=False, mode: str = "wb"):
         """Put given contents in folder."""
         self.mkdir()
@@ -125,18 +162,23 @@ class GCSFolder(Folder):
             )
 
         if overwrite is False:
-            # Check if files exist and raise an error if they do
-            existing_files = [
-                blob.name for blob in self.client.list_blobs(self.bucket, prefix=key)
-            ]
-            intersection = set(existing_files).intersection(set(contents.keys()))
+            # Check if files exist and raise an error if they do. Probe only the blobs being written rather than
+            # listing everything under the folder prefix.
+            filenames = list(contents.keys())
+            exists = self._run_concurrently(
+                lambda filename: self.bucket.blob(key + filename).exists(), filenames
+            )
+            intersection = {
+                filename for filename, found in zip(filenames, exists) if found
+            }
             if intersection:
                 raise FileExistsError(
                     f"File(s) {intersection} already exist(s) at path {key}, "
                     f"cannot save them without overwriting."
                 )
 
-        for filename, file_obj in contents.items():
+        def _upload_file(item):
+            filename, file_obj = item
             file_key = key + filename
             try:
                 blob = self.bucket.blob(file_key)
@@ -146,6 +188,8 @@ class GCSFolder(Folder):
             except Exception as e:
                 raise RuntimeError(f"Failed to upload {filename} to GCS: {e}")
 
+        self._run_concurrently(_upload_file, contents.items())
+
     def mv(self, system, path: Optional[str] = None):
         """Move the folder to a new filesystem or cluster."""
         if path is None:
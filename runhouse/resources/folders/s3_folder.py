@@ -1,4 +1,4 @@
-import copy
+import functools
 import shutil
 import subprocess
 import time
@@ -12,26 +12,44 @@ from .folder import Folder
 MAX_POLLS = 120000
 POLL_INTERVAL = 1
 TIMEOUT_SECONDS = 3600
+# Max number of keys accepted by a single S3 DeleteObjects request
+MAX_DELETE_BATCH_SIZE = 1000
 
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _s3_client():
+    """S3 client shared across folders, since building one resolves credentials and loads the service model."""
+    import boto3
+    from botocore.config import Config
+
+    # boto3 clients are thread-safe, but only keep 10 connections by default. Size the pool for the folder's
+    # concurrent transfers so they don't discard and re-open connections.
+    return boto3.client(
+        "s3", config=Config(max_pool_connections=Folder.MAX_CONCURRENT_TRANSFERS)
+    )
+
+
 class S3Folder(Folder):
     RESOURCE_TYPE = "folder"
     DEFAULT_FS = "s3"
 
     def __init__(self, dryrun: bool, **kwargs):
         try:
-            import boto3
+            import boto3  # noqa: F401
         except ImportError:
             raise ImportError(
                 "`boto3` is required for S3 folders. You can install it with `pip install boto3`."
             )
 
         super().__init__(dryrun=dryrun, **kwargs)
-        self.client = boto3.client("s3")
         self._urlpath = "s3://"
 
+    @property
+    def client(self):
+        return _s3_client()
+
     @staticmethod
     def from_config(config: Dict, dryrun: bool = False, _resolve_children: bool = True):
         """Load config values into the object."""
@@ -50,21 +68,28 @@ class S3Folder(Folder):
 
         return self._destination_folder(dest_path=dest_path, dest_system="file")
 
-    def _s3_copy_to_local(self, dest_path: str):
+    def _list_object_keys(self) -> List[str]:
+        """Keys of all objects in the folder, following pagination past the 1000 key page limit."""
+        paginator = self.client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(Bucket=self._bucket_name, Prefix=self._key)
+        return [obj["Key"] for page in pages for obj in page.get("Contents", [])]
+
+    def _s3_copy_to_local(self, dest_path: str, obj_keys: Optional[List[str]] = None):
         """Copy S3 folder to local."""
         Path(dest_path).mkdir(parents=True, exist_ok=True)
 
         bucket_name = self._bucket_name
         key = self._key
 
-        s3_objects = self.client.list_objects_v2(Bucket=bucket_name, Prefix=key)
-
-        for obj in s3_objects.get("Contents", []):
-            obj_key = obj["Key"]
+        def _download_object(obj_key):
             dest_file_path = Path(dest_path) / Path(obj_key).relative_to(key)
             dest_file_path.parent.mkdir(parents=True, exist_ok=True)
             self.client.download_file(bucket_name, obj_key, str(dest_file_path))
 
+        if obj_keys is None:
+            obj_keys = self._list_object_keys()
+        self._run_concurrently(_download_object, obj_keys)
+
     def _cluster_to_local(self, cluster, dest_path):
         if not cluster.ips:
             raise ValueError("Cluster must be started before copying data from it.")
@@ -76,50 +101,47 @@ class S3Folder(Folder):
             up=False,
             contents=True,
         )
-        new_folder = copy.deepcopy(self)
-        new_folder.path = dest_path
-        new_folder.system = "file"
-        return new_folder
+        return self._clone(path=dest_path, system="file")
 
-    def _move_within_s3(self, new_path):
-        bucket_name = self._bucket_name
-        key = self._key
-        s3_objects = self.client.list_objects_v2(Bucket=bucket_name, Prefix=key)
-        for obj in s3_objects.get("Contents", []):
-            old_key = obj["Key"]
-            new_key = new_path + old_key[len(key) :]
-            self.client.copy_object(
-                Bucket=bucket_name,
-                CopySource={"Bucket": bucket_name, "Key": old_key},
-                Key=new_key,
+    def _delete_objects(self, keys: List[str]):
+        """Delete objects from the bucket, in batches of the max number of keys S3 accepts per request."""
+        for i in range(0, len(keys), MAX_DELETE_BATCH_SIZE):
+            self.client.delete_objects(
+                Bucket=self._bucket_name,
+                Delete={
+                    "Objects": [
+                        {"Key": key} for key in keys[i : i + MAX_DELETE_BATCH_SIZE]
+                    ]
+                },
             )
-            self.client.delete_object(Bucket=bucket_name, Key=old_key)
+
+    def _move_within_s3(self, new_path):
+        obj_keys = self._list_object_keys()
+        self._s3_copy(new_path, obj_keys=obj_keys)
+        # Only delete the source objects once all of them have been copied over
+        self._delete_objects(obj_keys)
 
     def _s3_to_local(self, local_path):
-        bucket_name = self._bucket_name
-        key = self._key
-        Path(local_path).mkdir(parents=True, exist_ok=True)
-        s3_objects = self.client.list_objects_v2(Bucket=bucket_name, Prefix=key)
-        for obj in s3_objects.get("Contents", []):
-            obj_key = obj["Key"]
-            dest_file_path = Path(local_path) / Path(obj_key).relative_to(key)
-            dest_file_path.parent.mkdir(parents=True, exist_ok=True)
-            self.client.download_file(bucket_name, obj_key, str(dest_file_path))
-            self.client.delete_object(Bucket=bucket_name, Key=obj_key)
+        obj_keys = self._list_object_keys()
+        self._s3_copy_to_local(local_path, obj_keys=obj_keys)
+        self._delete_objects(obj_keys)
 
-    def _s3_copy(self, new_path):
+    def _s3_copy(self, new_path, obj_keys: Optional[List[str]] = None):
         bucket_name = self._bucket_name
         key = self._key
-        s3_objects = self.client.list_objects_v2(Bucket=bucket_name, Prefix=key)
-        for obj in s3_objects.get("Contents", []):
-            old_key = obj["Key"]
-            new_key = new_path + old_key[len(key) :]
+
+        def _copy_object(old_key):
+            # Server-side copy, the object contents never leave S3
             self.client.copy_object(
                 Bucket=bucket_name,
                 CopySource={"Bucket": bucket_name, "Key": old_key},
-                Key=new_key,
+                Key=new_path + old_key[len(key) :],
             )
 
+        if obj_keys is None:
+            obj_keys = self._list_object_keys()
+        self._run_concurrently(_copy_object, obj_keys)
+
     def put(
         self,
         contents: Union["S3Folder", Dict],
@@ -147,21 +169,30 @@ class S3Folder(Folder):
             )
 
         if overwrite is False:
-            # Check if files exist and raise an error if they do
-            existing_files = [
-                obj["Key"]
-                for obj in self.client.list_objects_v2(
-                    Bucket=bucket_name, Prefix=key
-                ).get("Contents", [])
-            ]
-            intersection = set(existing_files).intersection(set(contents.keys()))
+            # Check if files exist and raise an error if they do. Probe only the keys being written rather than
+            # listing everything under the folder prefix.
+            def _file_exists(filename):
+                file_key = key + filename
+                response = self.client.list_objects_v2(
+                    Bucket=bucket_name, Prefix=file_key, MaxKeys=1
+                )
+                return any(
+                    obj["Key"] == file_key for obj in response.get("Contents", [])
+                )
+
+            filenames = list(contents.keys())
+            exists = self._run_concurrently(_file_exists, filenames)
+            intersection = {
+                filename for filename, found in zip(filenames, exists) if found
+            }
             if intersection:
                 raise FileExistsError(
                     f"File(s) {intersection} already exist(s) at path {key}, "
                     f"cannot save them without overwriting."
                 )
 
-        for filename, file_obj in contents.items():
+        def _upload_file(item):
+            filename, file_obj = item
             file_key = key + filename
             try:
                 body = self._serialize_file_obj(file_obj)
@@ -170,6 +201,8 @@ class S3Folder(Folder):
             except Exception as e:
                 raise RuntimeError(f"Failed to upload {filename} to S3: {e}")
 
+        self._run_concurrently(_upload_file, contents.items())
+
     def mv(self, system, path: Optional[str] = None):
         """Move the folder to a new filesystem or cluster."""
         if path is None:
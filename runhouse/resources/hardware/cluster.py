@@ -951,7 +951,7 @@ class Cluster(Resource):
                 system=self,
             )
         except KeyError as e:
-            if default == KeyError:
+            if default is KeyError:
                 raise e
             return default
         return res
@@ -1709,12 +1709,13 @@ class Cluster(Resource):
                 raise ValueError(f"Destination {dest} is not a directory.")
             dest = str(dest) + "/" if contents else str(dest)
 
+            # -a is archive mode, -v is verbose. No -z, since compressing a local copy only costs CPU.
             cmd = [
                 "rsync",
-                "-avz",
+                "-av",
                 source,
                 dest,
-            ]  # -a is archive mode, -v is verbose, -z is compress
+            ]
             if ignore_existing:
                 cmd += ["--ignore-existing"]
             if filter_options:
@@ -2360,8 +2361,20 @@ class Cluster(Resource):
             secrets.update(enabled_provider_secrets)
             secrets = secrets.values()
 
-        for secret in secrets:
-            secret.to(self, process=process)
+        secrets = list(secrets)
+        if len(secrets) <= 1:
+            for secret in secrets:
+                secret.to(self, process=process)
+            return
+
+        # Each secret is sent and written down independently, so issue them concurrently rather than paying
+        # for a full round trip per secret
+        with ThreadPoolExecutor(max_workers=min(32, len(secrets))) as executor:
+            futures = [
+                executor.submit(secret.to, self, process=process) for secret in secrets
+            ]
+            for future in futures:
+                future.result()
 
     def ipython(self):
         # TODO tunnel into python interpreter in cluster
@@ -353,9 +353,18 @@ def get_source_object_size(path: str):
     object_path = Path(path)
     try:
         if object_path.is_dir():
-            # checks the size of all objects in the folder, including subdirectories. rglob is a recursive method, so it
-            # checks all files in all sub-folders, if such exist.
-            return sum(f.stat().st_size for f in object_path.rglob("*") if f.is_file())
+            # checks the size of all objects in the folder, including subdirectories. scandir entries carry their
+            # file type, so only regular files need a stat call while walking the tree.
+            total_size = 0
+            dirs_to_scan = [object_path]
+            while dirs_to_scan:
+                with os.scandir(dirs_to_scan.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs_to_scan.append(entry.path)
+                        elif entry.is_file():
+                            total_size += entry.stat().st_size
+            return total_size
         else:
             return object_path.stat().st_size
     except FileNotFoundError:
@@ -19,6 +19,7 @@ from runhouse.resources.hardware.utils import (
 from runhouse.resources.resource import Resource
 
 from runhouse.utils import (
+    _clear_metadata_cache,
     conda_env_cmd,
     find_locally_installed_version,
     get_local_install_path,
@@ -254,6 +255,10 @@ class Package(Resource):
                 f"{self.install_method} install '{install_cmd}' failed, check that the package exists and is available for your platform."
             )
 
+        if not cluster:
+            # Installed into this environment, so drop any cached package metadata
+            _clear_metadata_cache()
+
     def _install(
         self,
         cluster: "Cluster" = None,
@@ -1,5 +1,4 @@
 import configparser
-import copy
 import os
 
 from typing import Dict
@@ -31,9 +30,9 @@ class AzureSecret(ProviderSecret):
         overwrite: bool = False,
         write_config: bool = True,
     ):
-        new_secret = copy.deepcopy(self)
+        new_secret = self._clone_shallow()
         if not _check_file_for_mismatches(
-            path, self._from_path(path), values, overwrite
+            path, None if overwrite else self._from_path(path), values, overwrite
         ):
             subscription_id = values["subscription_id"]
 
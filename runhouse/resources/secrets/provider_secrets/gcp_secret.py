@@ -1,4 +1,3 @@
-import copy
 import json
 import os
 from pathlib import Path
@@ -34,9 +33,9 @@ class GCPSecret(ProviderSecret):
         overwrite: bool = False,
         write_config: bool = True,
     ):
-        new_secret = copy.deepcopy(self)
+        new_secret = self._clone_shallow()
         if not _check_file_for_mismatches(
-            path, self._from_path(path), values, overwrite
+            path, None if overwrite else self._from_path(path), values, overwrite
         ):
             Path(path).parent.mkdir(parents=True, exist_ok=True)
 
@@ -1,4 +1,3 @@
-import copy
 import os
 from pathlib import Path
 
@@ -32,9 +31,9 @@ class HuggingFaceSecret(ProviderSecret):
         overwrite: bool = False,
         write_config: bool = True,
     ):
-        new_secret = copy.deepcopy(self)
+        new_secret = self._clone_shallow()
         if not _check_file_for_mismatches(
-            path, self._from_path(path), values, overwrite
+            path, None if overwrite else self._from_path(path), values, overwrite
         ):
             token = values["token"]
             full_path = create_local_dir(path)
@@ -1,4 +1,3 @@
-import copy
 import os
 from typing import Dict
 
@@ -45,10 +44,10 @@ class KubeConfigSecret(ProviderSecret):
         overwrite: bool = False,
         write_config: bool = True,
     ):
-        new_secret = copy.deepcopy(self)
+        new_secret = self._clone_shallow()
         path = path or self.path
         if not _check_file_for_mismatches(
-            path, self._from_path(path), values, overwrite
+            path, None if overwrite else self._from_path(path), values, overwrite
         ):
             full_path = create_local_dir(path)
             with open(full_path, "w") as f:
@@ -1,6 +1,9 @@
 import copy
 import json
 import os
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
@@ -12,6 +15,52 @@ from runhouse.resources.secrets.secret import Secret
 from runhouse.resources.secrets.utils import _check_file_for_mismatches
 from runhouse.utils import create_local_dir
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Credential files above this size are stream-parsed (if ijson is installed) rather than read into memory whole
+_STREAM_PARSE_MIN_SIZE = 256 * 1024
+
+# Parsed credential files, keyed on (path, mtime_ns, size) so that edits to the file on disk miss the cache
+_PATH_CACHE_MAX_SIZE = 128
+_path_cache: OrderedDict = OrderedDict()
+
+
+def _invalidate_path_cache(path: str):
+    for cache_key in [k for k in _path_cache if k[0] == path]:
+        _path_cache.pop(cache_key, None)
+
+
+def _expanduser(path: Union[str, Path]) -> str:
+    # Only paths starting with "~" need expanding, skip the home directory lookup for all others
+    path = os.fspath(path)
+    return os.path.expanduser(path) if path.startswith("~") else path
+
+
+def _load_json_file(path: str, size: int):
+    """Parse a JSON credentials file, returning its raw text contents if it is not valid JSON."""
+    with open(path, "rb") as f:
+        if ijson and size > _STREAM_PARSE_MIN_SIZE:
+            try:
+                return next(ijson.items(f, "", use_float=True))
+            except (ijson.JSONError, StopIteration):
+                f.seek(0)
+                return f.read().decode()
+
+        raw = f.read()
+    try:
+        return orjson.loads(raw) if orjson else json.loads(raw)
+    except ValueError:
+        # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
+        return raw.decode()
+
 
 class ProviderSecret(Secret):
     _PROVIDER = None
@@ -43,16 +92,31 @@ class ProviderSecret(Secret):
         self.path = path
         self.env_vars = env_vars
 
-        if not any([values, path, env_vars]):
-            if self._from_path(self._DEFAULT_CREDENTIALS_PATH):
-                self.path = self._DEFAULT_CREDENTIALS_PATH
-            elif self._from_env(self._DEFAULT_ENV_VARS):
-                self.env_vars = self._DEFAULT_ENV_VARS
-            else:
+        if values or path or env_vars:
+            # Source is given explicitly (e.g. when loading from a config), no need to probe the defaults
+            return
+
+        default_values = self._from_path(self._DEFAULT_CREDENTIALS_PATH)
+        if default_values:
+            self.path = self._DEFAULT_CREDENTIALS_PATH
+        else:
+            default_values = self._from_env(self._DEFAULT_ENV_VARS)
+            if not default_values:
                 raise ValueError(
                     "Secrets values not provided and could not be extracted from default file "
                     f"({self._DEFAULT_CREDENTIALS_PATH}) or env vars ({self._DEFAULT_ENV_VARS.values()}) locations."
                 )
+            self.env_vars = self._DEFAULT_ENV_VARS
+
+    @property
+    def env_vars(self):
+        return self._env_vars
+
+    @env_vars.setter
+    def env_vars(self, env_vars: Dict):
+        self._env_vars = env_vars
+        # (key, env var) pairs, precomputed for mapping values to and from the environment
+        self._env_items = tuple(env_vars.items()) if env_vars else ()
 
     @property
     def values(self):
@@ -96,12 +160,12 @@ class ProviderSecret(Secret):
         """Delete the secret config from Den and from Vault/local. Optionally also delete contents of secret file
         or env vars."""
         headers = headers or rns_client.request_headers()
-        if self.path and contents and os.path.exists(os.path.expanduser(self.path)):
-            os.remove(os.path.expanduser(self.path))
+        full_path = _expanduser(self.path) if self.path else None
+        if full_path and contents and os.path.exists(full_path):
+            os.remove(full_path)
         elif self.env_vars and contents:
-            for (_, env_var) in self.env_vars.keys():
-                if env_var in os.environ:
-                    del os.environ[env_var]
+            for env_var in self.env_vars.values():
+                os.environ.pop(env_var, None)
         super().delete(headers=headers)
 
     def write(
@@ -165,15 +229,14 @@ class ProviderSecret(Secret):
                 return self
             self.write(path=path)
             if path and len(system.ips) > 1:
-                for node in system.ips[1:]:
-                    system._local_rsync(src=path, dest=Path(path).parent, node=node)
-            new_secret = copy.deepcopy(self)
+                self._rsync_to_worker_nodes(system, path)
+            new_secret = self._clone_shallow()
             new_secret._values = None
             new_secret.path = path
             new_secret.name = name or self.name
             return new_secret
 
-        new_secret = copy.deepcopy(self)
+        new_secret = self._clone_shallow()
         new_secret.name = name or self.name or self.provider
 
         if values:
@@ -190,8 +253,7 @@ class ProviderSecret(Secret):
                 key=key, system=system, path=path, values=self.values
             )
             if len(system.ips) > 1:
-                for node in system.ips[1:]:
-                    system._local_rsync(source=path, dest=Path(path).parent, node=node)
+                self._rsync_to_worker_nodes(system, path)
         if process or self.env_vars:
             env_vars = self.env_vars or self._DEFAULT_ENV_VARS
             if env_vars:
@@ -199,12 +261,36 @@ class ProviderSecret(Secret):
                 system.set_env_vars_globally(env_vars=env_vars)
         return new_secret
 
+    def _clone_shallow(self):
+        # Copy of the secret sharing attribute values with self. Attributes are only ever rebound on the copy,
+        # never mutated in place, so this avoids the cost of a full deepcopy on every write / to().
+        new_secret = object.__new__(type(self))
+        new_secret.__dict__ = self.__dict__.copy()
+        return new_secret
+
+    @staticmethod
+    def _rsync_to_worker_nodes(system: Cluster, path: str):
+        worker_ips = system.ips[1:]
+        with ThreadPoolExecutor(max_workers=min(32, len(worker_ips))) as executor:
+            futures = [
+                executor.submit(
+                    system._local_rsync,
+                    source=path,
+                    dest=Path(path).parent,
+                    node=node,
+                )
+                for node in worker_ips
+            ]
+            for future in futures:
+                future.result()
+
     def _map_env_vars(self, env_vars: Dict = None):
-        env_vars = env_vars or self.env_vars or self._DEFAULT_ENV_VARS
-        mapped_env_vars = {
-            env_vars[k]: self.values[k] for k in self.values if k in env_vars
-        }
-        return mapped_env_vars
+        if env_vars:
+            env_items = env_vars.items()
+        else:
+            env_items = self._env_items or self._DEFAULT_ENV_VARS.items()
+        values = self.values
+        return {env_var: values[key] for key, env_var in env_items if key in values}
 
     def _file_to(
         self,
@@ -219,13 +305,48 @@ class ProviderSecret(Secret):
     def _write_to_file(
         self, path: str, values: Any, overwrite: bool = False, write_config: bool = True
     ):
-        new_secret = copy.deepcopy(self)
+        new_secret = self._clone_shallow()
         if not _check_file_for_mismatches(
-            path, self._from_path(path), values, overwrite
+            path, None if overwrite else self._from_path(path), values, overwrite
         ):
-            full_path = create_local_dir(path)
-            with open(full_path, "w") as f:
-                json.dump(values, f, indent=4)
+            full_path = str(create_local_dir(path))
+            if orjson:
+                contents = orjson.dumps(
+                    values, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+                )
+            else:
+                # Match orjson's output (which only supports a 2 space indent) so the file doesn't depend on
+                # whether orjson is installed
+                contents = (
+                    json.dumps(values, indent=2, ensure_ascii=False) + "\n"
+                ).encode()
+
+            # Write to a temp file and rename it over the target, so a failed write never leaves behind
+            # a truncated credentials file. mkstemp creates the file with a unique name (secrets may be written
+            # from several threads at once) and 0600 permissions, so the credentials are never readable by others.
+            # Symlinks are resolved first so that the link's target is replaced, not the link itself.
+            target_path = os.path.realpath(full_path)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(target_path),
+                prefix=f".{os.path.basename(target_path)}.",
+                suffix=".tmp",
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(contents)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, target_path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+            _invalidate_path_cache(full_path)
+            if target_path != full_path:
+                _invalidate_path_cache(target_path)
 
             if write_config:
                 self._add_to_rh_config(path)
@@ -235,61 +356,61 @@ class ProviderSecret(Secret):
         return new_secret
 
     def _write_to_env(self, env_vars: Dict, values: Any, overwrite: bool):
-        existing_keys = dict(os.environ).keys()
+        environ = os.environ
         added_keys = []
-        for key in env_vars.keys():
-            if env_vars[key] not in existing_keys or overwrite:
-                os.environ[env_vars[key]] = values[key]
-                added_keys.append(env_vars[key])
+        for key, env_var in env_vars.items():
+            if overwrite or env_var not in environ:
+                environ[env_var] = values[key]
+                added_keys.append(env_var)
 
         if added_keys:
             self._add_to_rh_config(added_keys)
 
-        new_secret = copy.deepcopy(self)
+        new_secret = self._clone_shallow()
         new_secret._values = None
         new_secret.env_vars = env_vars
         return new_secret
 
     def _from_env(self, env_vars: Dict = None):
-        env_vars = env_vars or self.env_vars
-        if not env_vars:
+        env_items = env_vars.items() if env_vars else self._env_items
+        if not env_items:
             return {}
 
-        values = {}
-
-        for key in env_vars.keys():
-            try:
-                values[key] = os.environ[env_vars[key]]
-            except KeyError:
-                return {}
-        return values
+        environ = os.environ
+        if not all(env_var in environ for _, env_var in env_items):
+            return {}
+        return {key: environ[env_var] for key, env_var in env_items}
 
     def _from_path(self, path: str = None):
         path = path or self.path
         if not path:
             return {}
 
-        path = os.path.expanduser(path)
-        if os.path.exists(path):
-            with open(path) as f:
-                try:
-                    contents = json.load(f)
-                except json.decoder.JSONDecodeError:
-                    contents = f.read()
-                return contents
-        return {}
+        path = _expanduser(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return {}
+
+        cache_key = (path, stat.st_mtime_ns, stat.st_size)
+        if cache_key in _path_cache:
+            _path_cache.move_to_end(cache_key)
+            return copy.deepcopy(_path_cache[cache_key])
+
+        contents = _load_json_file(path, size=stat.st_size)
+        _path_cache[cache_key] = contents
+        if len(_path_cache) > _PATH_CACHE_MAX_SIZE:
+            _path_cache.popitem(last=False)
+        return copy.deepcopy(contents)
 
     @staticmethod
     def extract_secrets_from_path(path: str) -> Union[str, None]:
-        secret_path = os.path.expanduser(path)
-
-        if not os.path.exists(secret_path):
+        try:
+            with open(_expanduser(path), "rb") as f:
+                return f.read().decode()
+        except FileNotFoundError:
             return None
 
-        provider_secret = Path(secret_path).read_text()
-
-        return provider_secret
-
     def _add_to_rh_config(self, val):
         if not self.name:
             self.name = self.provider
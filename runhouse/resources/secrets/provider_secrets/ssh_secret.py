@@ -1,4 +1,3 @@
-import copy
 import os
 from pathlib import Path
 
@@ -135,7 +134,7 @@ class SSHSecret(ProviderSecret):
             pub_key_path.write_text(public_key)
             pub_key_path.chmod(0o600)
 
-        new_secret = copy.deepcopy(self)
+        new_secret = self._clone_shallow()
         new_secret._values = None
         new_secret.path = path
         new_secret.name = f"ssh-{os.path.basename(path)}"
@@ -2,6 +2,7 @@ import contextvars
 import copy
 import json
 import os
+import threading
 from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -45,6 +46,9 @@ class Defaults:
         self._defaults_cache = defaultdict(dict)
         self._simulate_logged_out = False
         self._use_caller_token = False
+        # Guards the in-memory config and its rewrite to disk, which can happen from several threads at once (e.g.
+        # secrets being synced to a cluster concurrently)
+        self._config_lock = threading.RLock()
 
     @property
     def token(self):
@@ -212,15 +216,16 @@ class Defaults:
         self, defaults: Optional[Dict] = None, config_path: Optional[str] = None
     ):
         config_path = Path(config_path or self.CONFIG_PATH)
-        defaults = defaults or self.defaults_cache
-        if not defaults:
-            return
+        with self._config_lock:
+            defaults = defaults or self.defaults_cache
+            if not defaults:
+                return
 
-        if not config_path.exists():
-            config_path.parent.mkdir(parents=True, exist_ok=True)
+            if not config_path.exists():
+                config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with config_path.open("w") as stream:
-            yaml.safe_dump(defaults, stream)
+            with config_path.open("w") as stream:
+                yaml.safe_dump(defaults, stream)
 
     def download_and_save_defaults(
         self,
@@ -233,19 +238,22 @@ class Defaults:
         self.set_many(defaults, config_path=config_path)
 
     def set(self, key: str, value: Any, config_path: Optional[str] = None):
-        self.defaults_cache[key] = value
-        self.save_defaults(config_path=config_path)
+        with self._config_lock:
+            self.defaults_cache[key] = value
+            self.save_defaults(config_path=config_path)
 
     def set_nested(self, key: str, value: Any, config_path: Optional[str] = None):
         """Set a config key that has multiple key/value pairs"""
-        if not self.defaults_cache.get(key):
-            self.defaults_cache.setdefault(key, {})
-        self.defaults_cache[key].update(value)
-        self.save_defaults(config_path=config_path)
+        with self._config_lock:
+            if not self.defaults_cache.get(key):
+                self.defaults_cache.setdefault(key, {})
+            self.defaults_cache[key].update(value)
+            self.save_defaults(config_path=config_path)
 
     def set_many(self, key_value_pairs: Dict, config_path: Optional[str] = None):
-        self.defaults_cache.update(key_value_pairs)
-        self.save_defaults(config_path=config_path)
+        with self._config_lock:
+            self.defaults_cache.update(key_value_pairs)
+            self.save_defaults(config_path=config_path)
 
     # TODO [DG] allow hierarchical defaults from folders and groups
     def get(self, key: str, alt: Any = None) -> Any:
@@ -261,14 +269,16 @@ class Defaults:
 
     def delete(self, key: str):
         """Remove a specific key from the config"""
-        self.defaults_cache.pop(key, None)
-        self.save_defaults()
+        with self._config_lock:
+            self.defaults_cache.pop(key, None)
+            self.save_defaults()
 
     def delete_provider(self, provider: str):
         """Remove a specific provider from the config secrets."""
-        if self.defaults_cache.get("secrets"):
-            self.defaults_cache.get("secrets").pop(provider, None)
-        self.save_defaults()
+        with self._config_lock:
+            if self.defaults_cache.get("secrets"):
+                self.defaults_cache.get("secrets").pop(provider, None)
+            self.save_defaults()
 
     def delete_defaults(self, config_path: Optional[str] = None):
         """Delete the defaults file entirely"""
@@ -116,12 +116,16 @@ class RNSClient:
 
     def _index_base_folders(self, lst):
         self.rns_base_folders = {}
+        # Reverse index of local path -> rns path, for constant time lookups when resolving folder addresses
+        self.rns_base_folder_paths = {}
         for folder in lst:
             config = self._load_config_from_local(path=folder)
             rns_path = str(Path(self.default_folder) / Path(folder).name)
             if config:
                 rns_path = config.get("rns_address")
             self.rns_base_folders[rns_path] = folder
+            if rns_path:
+                self.rns_base_folder_paths[folder] = rns_path
 
     @staticmethod
     def resource_uri(name):
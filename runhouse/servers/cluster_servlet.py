@@ -4,7 +4,8 @@ import datetime
 import json
 import os
 import threading
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import httpx
 
@@ -20,7 +21,6 @@ from runhouse.constants import (
     INCREASED_GPU_COLLECTION_INTERVAL,
     INCREASED_STATUS_CHECK_INTERVAL,
     MAX_GPU_INFO_LEN,
-    REDUCED_GPU_INFO_LEN,
     SERVER_LOGFILE,
     SERVER_LOGS_FILE_NAME,
 )
@@ -35,6 +35,7 @@ from runhouse.rns.utils.api import ResourceAccess
 from runhouse.servers.autostop_helper import AutostopHelper
 from runhouse.servers.http.auth import AuthCache
 from runhouse.servers.http.http_utils import CreateProcessParams
+from runhouse.servers.obj_store import ObjStoreError
 from runhouse.utils import (
     ColoredFormatter,
     get_pid,
@@ -118,6 +119,16 @@ class ClusterServlet:
         )
         self.autostop_check_thread.start()
 
+    ##############################################
+    # Batched calls
+    ##############################################
+    async def abatch(self, ops: List[Tuple[str, tuple, dict]]) -> List[Any]:
+        """Run several of this servlet's methods, given as (method_name, args, kwargs) tuples, in order and
+        return their results, so callers needing several values pay for one actor round trip instead of one each."""
+        return [
+            await getattr(self, method)(*args, **kwargs) for method, args, kwargs in ops
+        ]
+
     ##############################################
     # List of node servlet names
     ##############################################
@@ -233,19 +244,25 @@ class ClusterServlet:
     async def aget_username(self, token: str) -> str:
         return self._auth_cache.get_username(token)
 
-    async def ahas_resource_access(self, token: str, resource_uri=None) -> bool:
-        """Checks whether user has read or write access to a given module saved on the cluster."""
-        from runhouse.rns.utils.api import ResourceAccess
-
-        if token is None or self._cluster_name is None:
-            # If no token or cluster uri are provided assume no access
+    async def ahas_resource_access(
+        self, token: str, cluster_uri: str, resource_uri=None
+    ) -> bool:
+        """Checks whether the user has access to the resource either through their access to the cluster or to the
+        resource itself. Runs both access level lookups here so callers only make one round trip."""
+        if token is None:
+            # If no token is provided assume no access
             return False
 
-        cluster_access = await self.aresource_access_level(token, self._cluster_name)
+        cluster_access = await self.aresource_access_level(token, cluster_uri)
         if cluster_access == ResourceAccess.WRITE:
             # if user has write access to cluster will have access to all resources
             return True
 
+        if resource_uri != cluster_uri and cluster_access == ResourceAccess.READ:
+            # If the user has READ access to the cluster and this isn't a cluster management
+            # endpoint, they have access to all resources
+            return True
+
         if resource_uri is None and cluster_access not in [
             ResourceAccess.WRITE,
             ResourceAccess.READ,
@@ -254,10 +271,7 @@ class ClusterServlet:
             return False
 
         resource_access_level = await self.aresource_access_level(token, resource_uri)
-        if resource_access_level not in [ResourceAccess.WRITE, ResourceAccess.READ]:
-            return False
-
-        return True
+        return resource_access_level in [ResourceAccess.WRITE, ResourceAccess.READ]
 
     async def aclear_auth_cache(self, token: str = None):
         self._auth_cache.clear_cache(token)
@@ -273,7 +287,9 @@ class ClusterServlet:
     async def ais_servlet_name_initialized(self, servlet_name: str) -> bool:
         return servlet_name in self._initialized_servlet_args
 
-    async def aget_all_initialized_servlet_args(self) -> Set[str]:
+    async def aget_all_initialized_servlet_args(
+        self,
+    ) -> Dict[str, CreateProcessParams]:
         return self._initialized_servlet_args
 
     async def aget_key_to_servlet_name_dict_keys(self) -> List[Any]:
@@ -298,6 +314,12 @@ class ClusterServlet:
         # *args allows us to pass default or not
         return self._key_to_servlet_name.pop(key, *args)
 
+    async def apop_servlet_name_for_keys(self, keys: List[Any], servlet_name: str):
+        # Only drop the keys this servlet actually holds, so a stale caller can't orphan keys held elsewhere
+        for key in keys:
+            if self._key_to_servlet_name.get(key) == servlet_name:
+                del self._key_to_servlet_name[key]
+
     async def aclear_key_to_servlet_name_dict(self):
         self._key_to_servlet_name = {}
 
@@ -605,7 +627,10 @@ class ClusterServlet:
                 gpu_count = pynvml.nvmlDeviceGetCount()
                 with self.lock:
                     if not self.gpu_metrics:
-                        self.gpu_metrics = {device: [] for device in range(gpu_count)}
+                        self.gpu_metrics = {
+                            device: deque(maxlen=MAX_GPU_INFO_LEN)
+                            for device in range(gpu_count)
+                        }
 
                     for gpu_index in range(gpu_count):
                         handle = pynvml.nvmlDeviceGetHandleByIndex(gpu_index)
@@ -618,13 +643,10 @@ class ClusterServlet:
                         utilization_percent = float(util_info.gpu)  # make it float
 
                         # to reduce cluster memory usage (we are saving the gpu_usage info on the cluster),
-                        # we save only the most updated gpu usage. If for some reason the size of updated_gpu_info is
-                        # too big, we remove the older gpu usage info.
+                        # we save only the most updated gpu usage. Once MAX_GPU_INFO_LEN samples are saved, the oldest
+                        # one is dropped as a new one is appended.
                         # This is relevant when using cluster.status() directly and not relying on status being sent to den.
-                        updated_gpu_info = self.gpu_metrics[gpu_index]
-                        if len(updated_gpu_info) + 1 > MAX_GPU_INFO_LEN:
-                            updated_gpu_info = updated_gpu_info[REDUCED_GPU_INFO_LEN:]
-                        updated_gpu_info.append(
+                        self.gpu_metrics[gpu_index].append(
                             {
                                 "total_memory": total_memory,
                                 "used_memory": used_memory,
@@ -632,7 +654,6 @@ class ClusterServlet:
                                 "utilization_percent": utilization_percent,
                             }
                         )
-                        self.gpu_metrics[gpu_index] = updated_gpu_info
 
             except Exception as e:
                 logger.error(
@@ -662,7 +683,10 @@ class ClusterServlet:
     ):
 
         updated_workers_usage = []
-        head_collected_gpus_info = copy.deepcopy(self.gpu_metrics)
+        # The collector thread appends to (and evicts from) the per-gpu deques under the lock, and copying a deque
+        # while it's being mutated raises
+        with self.lock:
+            head_collected_gpus_info = copy.deepcopy(self.gpu_metrics)
 
         if not is_multinode and (
             not head_collected_gpus_info or not head_collected_gpus_info[0]
@@ -685,22 +709,30 @@ class ClusterServlet:
             compute_properties.get("internal_ips", None) if compute_properties else None
         )
         if is_multinode and internal_ips and self._are_multinode_servlets_ready:
-            for ip_index in range(1, len(internal_ips)):
-                worker_resource_usage = workers_usage[ip_index]
-                if self._are_multinode_servlets_ready:
-                    node_servlet_name = obj_store.node_servlet_name_for_ip(
-                        internal_ips[ip_index]
-                    )
-                    node_servlet = obj_store.get_servlet(name=node_servlet_name)
-                    worker_gpu_usage = obj_store.call_actor_method(
-                        node_servlet, "get_gpu_metrics", send_to_den
-                    )
-                    worker_gpu_usage = parse_gpu_usage(
-                        collected_gpu_info=worker_gpu_usage,
-                        servlet_type=ServletType.cluster,
+            import ray
+
+            # Request every worker node's GPU metrics up front and wait on them together, rather than making a
+            # blocking round trip to each node in turn
+            workers_gpu_metrics_refs = []
+            for ip in internal_ips[1:]:
+                node_servlet = obj_store.get_servlet(
+                    name=obj_store.node_servlet_name_for_ip(ip)
+                )
+                if node_servlet is None:
+                    raise ObjStoreError(
+                        "Attempting to call an actor method on a None actor."
                     )
-                    worker_resource_usage["server_gpu_usage"] = worker_gpu_usage
+                workers_gpu_metrics_refs.append(
+                    node_servlet.get_gpu_metrics.remote(send_to_den)
+                )
 
+            for worker_resource_usage, worker_gpu_metrics in zip(
+                workers_usage[1:], ray.get(workers_gpu_metrics_refs)
+            ):
+                worker_resource_usage["server_gpu_usage"] = parse_gpu_usage(
+                    collected_gpu_info=worker_gpu_metrics,
+                    servlet_type=ServletType.cluster,
+                )
                 updated_workers_usage.append(worker_resource_usage)
 
         return updated_workers_usage
@@ -1,3 +1,4 @@
+import time
 from typing import Optional, Union
 
 from runhouse.globals import rns_client
@@ -9,7 +10,10 @@ logger = get_logger(__name__)
 
 
 class AuthCache:
-    # Maps a user's token to all the resources they have access to
+    # How long an access level loaded from Den is reused before it's looked up again
+    ACCESS_LEVEL_TTL_SEC = 30
+
+    # Maps a user's token and a resource to their access level for it, and when it was loaded
     def __init__(self):
         self.CACHE = {}
         self.USERNAMES = {}
@@ -24,17 +28,23 @@ class AuthCache:
         return self.USERNAMES.get(token)
 
     def lookup_access_level(
-        self, token: str, resource_uri: str, refresh_cache=True
+        self, token: str, resource_uri: str, refresh_cache=False
     ) -> Union[str, None]:
-        """Get the access level of a particular resource for a user"""
+        """Get the access level of a particular resource for a user. Access levels loaded from Den within the last
+        ``ACCESS_LEVEL_TTL_SEC`` seconds are reused unless ``refresh_cache`` is set."""
         if token is None:
             return
 
         # Also add this user to the username cache
         self.get_username(token)
 
-        if (token, resource_uri) in self.CACHE and not refresh_cache:
-            return self.CACHE[(token, resource_uri)]
+        cached = self.CACHE.get((token, resource_uri))
+        if (
+            cached is not None
+            and not refresh_cache
+            and time.monotonic() - cached[1] < self.ACCESS_LEVEL_TTL_SEC
+        ):
+            return cached[0]
 
         if resource_uri.startswith("/"):
             resource_uri_to_send = resource_uri[1:].replace("/", ":")
@@ -59,9 +69,10 @@ class AuthCache:
             )
             return
 
-        self.CACHE[(token, resource_uri)] = resp.json()["data"]["access_level"]
+        access_level = resp.json()["data"]["access_level"]
+        self.CACHE[(token, resource_uri)] = (access_level, time.monotonic())
 
-        return self.CACHE[(token, resource_uri)]
+        return access_level
 
     def clear_cache(self, token: str = None):
         """Clear the server cache, If a token is specified, clear the cache for that particular user only"""
@@ -69,7 +80,7 @@ class AuthCache:
             self.CACHE = {}
             self.USERNAMES = {}
         else:
-            self.CACHE.pop(token, None)
+            self.CACHE = {k: v for k, v in self.CACHE.items() if k[0] != token}
             self.USERNAMES.pop(token, None)
 
 
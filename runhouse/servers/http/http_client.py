@@ -1,9 +1,10 @@
 import asyncio
 import json
+import threading
 import time
 import warnings
 
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from functools import wraps
 from pathlib import Path
 from random import randrange
@@ -12,6 +13,9 @@ from typing import Any, Dict, List, Optional, Union
 import httpx
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError
+from urllib3.util.retry import Retry
 
 from runhouse.globals import rns_client
 from runhouse.logger import get_logger
@@ -34,6 +38,7 @@ from runhouse.servers.http.http_utils import (
     LogsParams,
     OutputType,
     PutObjectParams,
+    PutObjectsParams,
     PutResourceParams,
     RenameObjectParams,
     RunBashParams,
@@ -43,13 +48,97 @@ from runhouse.servers.http.http_utils import (
 
 from runhouse.utils import ClusterLogsFormatter, generate_default_name, thread_coroutine
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Make this global so connections are pooled across instances of HTTPClient
 session = requests.Session()
 session.timeout = None
 
+
+class _RefusedConnectRetry(Retry):
+    """Only retries connects that were refused (e.g. while the server restarts), which fail fast. A connect that
+    timed out already burned the whole timeout (or the OS one, for POSTs sent without a timeout), so retrying it would
+    multiply the wait, e.g. for ``check_server`` against an unresponsive host or on top of
+    ``retry_with_exponential_backoff``."""
+
+    def increment(self, method=None, url=None, response=None, error=None, **kwargs):
+        # NewConnectionError (raised for any OSError on connect) subclasses ConnectTimeoutError
+        if isinstance(error, ConnectTimeoutError) and not isinstance(
+            error.__cause__, ConnectionRefusedError
+        ):
+            raise MaxRetryError(kwargs.get("_pool"), url, error) from error
+        return super().increment(
+            method=method, url=url, response=response, error=error, **kwargs
+        )
+
+
+# The default adapter only keeps 10 connections per host, so concurrent calls to a cluster (e.g. from a thread pool)
+# would discard and re-open connections instead of keeping them alive. Refused connects (the request never reached the
+# server) and gateway errors on reads (e.g. Caddy while the server restarts) are retried with a short backoff so a
+# transient tunnel hiccup doesn't surface as the cluster being down. Connect timeouts and read errors are never retried.
+_retry = _RefusedConnectRetry(
+    total=3,
+    connect=3,
+    read=False,
+    status=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=_retry)
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)
+
+# Shared across calls so each call doesn't spin up (and tear down) its own thread pool just to stream its logs
+_CALL_LOGS_MAX_WORKERS = 64
+_call_logs_executor = ThreadPoolExecutor(
+    max_workers=_CALL_LOGS_MAX_WORKERS, thread_name_prefix="rh-call-logs"
+)
+_call_logs_busy = 0
+_call_logs_lock = threading.Lock()
+
+
+def _release_call_logs_worker(*args):
+    global _call_logs_busy
+    with _call_logs_lock:
+        _call_logs_busy -= 1
+
+
+def _submit_call_logs(fn, *args) -> Future:
+    """Run ``fn`` on the shared call logs executor, or on a dedicated thread if all of its workers are busy. A log
+    stream runs for as long as its call, so it must never queue behind the streams of unrelated calls."""
+    global _call_logs_busy
+    with _call_logs_lock:
+        use_shared_executor = _call_logs_busy < _CALL_LOGS_MAX_WORKERS
+        if use_shared_executor:
+            _call_logs_busy += 1
+
+    if use_shared_executor:
+        future = _call_logs_executor.submit(fn, *args)
+        future.add_done_callback(_release_call_logs_worker)
+        return future
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rh-call-logs")
+    future = executor.submit(fn, *args)
+    # Lets the thread exit once the stream is done, without blocking on it here
+    executor.shutdown(wait=False)
+    return future
+
+
 logger = get_logger(__name__)
 
+LOCALHOST_NAMES = frozenset(("localhost", "127.0.0.1", "0.0.0.0"))
+
+
+def _json_loads(content: Union[str, bytes]):
+    """Parse a JSON response body or log line, with orjson if it's installed."""
+    return orjson.loads(content) if orjson else json.loads(content)
+
 
 def retry_with_exponential_backoff(func):
     @wraps(func)
@@ -75,6 +164,7 @@ class HTTPClient:
     """
 
     CHECK_TIMEOUT_SEC = 10
+    REQUEST_TYPES = frozenset(("get", "post", "put", "delete"))
 
     def __init__(
         self,
@@ -86,6 +176,7 @@ class HTTPClient:
         use_https=False,
         system=None,
     ):
+        self._base_url = None
         self.host = host
         self.port = port
         self.auth = auth
@@ -101,13 +192,21 @@ class HTTPClient:
             # setting of "True", which will verify the cluster's SSL certs
             self.verify = self.cert_path if self._certs_are_self_signed() else True
 
-        self.async_session = httpx.AsyncClient(
-            auth=self.auth, verify=self.verify, timeout=None
-        )
+        self._async_session = None
 
         self.log_formatter = ClusterLogsFormatter(self.system)
         self._request_headers = rns_client.request_headers(self.resource_address)
 
+    @property
+    def async_session(self):
+        # Built on first use, since constructing an httpx client (and its SSL context) takes a few ms and most
+        # clients only ever make sync calls
+        if self._async_session is None:
+            self._async_session = httpx.AsyncClient(
+                auth=self.auth, verify=self.verify, timeout=None
+            )
+        return self._async_session
+
     def _certs_are_self_signed(self) -> bool:
         """Checks whether the cert provided is self-signed. If it is, all client requests will include the path
         to the cert to be used for verification."""
@@ -163,11 +262,43 @@ class HTTPClient:
         client.use_https = use_https
         return client
 
+    # The base URL is built once and reused by every request, and rebuilt if the host, port or scheme change
+    @property
+    def host(self):
+        return self._host
+
+    @host.setter
+    def host(self, host: str):
+        self._host = host
+        self._base_url = None
+
+    @property
+    def port(self):
+        return self._port
+
+    @port.setter
+    def port(self, port: Optional[int]):
+        self._port = port
+        self._base_url = None
+
+    @property
+    def use_https(self):
+        return self._use_https
+
+    @use_https.setter
+    def use_https(self, use_https: bool):
+        self._use_https = use_https
+        self._base_url = None
+
     def _formatted_url(self, endpoint: str):
-        prefix = "https" if self.use_https else "http"
-        if self.port:
-            return f"{prefix}://{self.host}:{self.port}/{endpoint}"
-        return f"{prefix}://{self.host}/{endpoint}"
+        if self._base_url is None:
+            prefix = "https" if self.use_https else "http"
+            self._base_url = (
+                f"{prefix}://{self.host}:{self.port}"
+                if self.port
+                else f"{prefix}://{self.host}"
+            )
+        return f"{self._base_url}/{endpoint}"
 
     def request(
         self,
@@ -210,21 +341,12 @@ class HTTPClient:
     ):
         # Support use case where we explicitly do not want to provide headers (e.g. requesting a cert)
         headers = self._request_headers if headers != {} else headers
-        req_fn = (
-            session.get
-            if req_type == "get"
-            else session.put
-            if req_type == "put"
-            else session.delete
-            if req_type == "delete"
-            else session.post
-        )
+        if req_type not in self.REQUEST_TYPES:
+            raise ValueError(f"Invalid request type: {req_type}")
+        req_fn = getattr(session, req_type)
         # Note: For localhost (e.g. docker) do not add trailing slash (will lead to connection errors)
         endpoint = endpoint.strip("/")
-        if (
-            self.host not in ["localhost", "127.0.0.1", "0.0.0.0"]
-            and "?" not in endpoint
-        ):
+        if self.host not in LOCALHOST_NAMES and "?" not in endpoint:
             endpoint += "/"
 
         if req_type == "get":
@@ -248,7 +370,7 @@ class HTTPClient:
             raise ValueError(
                 f"Error calling {endpoint} on server: {response.content.decode()}"
             )
-        resp_json = response.json()
+        resp_json = _json_loads(response.content)
         if isinstance(resp_json, dict) and "output_type" in resp_json:
             return handle_response(
                 resp_json,
@@ -270,7 +392,7 @@ class HTTPClient:
                 f"Error checking server: {resp.content.decode()}. Is the server running?"
             )
 
-        rh_version = resp.json().get("rh_version", None)
+        rh_version = _json_loads(resp.content).get("rh_version", None)
         import runhouse
 
         if rh_version and not runhouse.__version__ == rh_version:
@@ -435,7 +557,7 @@ class HTTPClient:
             )
 
         # Measure the time it takes to send the message
-        start = time.time()
+        start = time.perf_counter()
         logger.info(
             f"{'Calling' if method_name else 'Getting'} {key}"
             + (f".{method_name}" if method_name else "")
@@ -443,20 +565,22 @@ class HTTPClient:
         serialization = serialization or "pickle"
         error_str = f"Error calling {method_name} on {key} on server"
 
-        with ThreadPoolExecutor() as executor:
-            # Run logs request in separate thread. Can start it before because it'll wait 5 seconds for the
-            # calls request to begin.
-            if stream_logs:
-                logs_future = executor.submit(
-                    thread_coroutine,
-                    self._alogs_request(
-                        run_name=run_name,
-                        key=key,
-                        serialization=serialization,
-                        error_str=error_str,
-                        create_async_client=True,
-                    ),
-                )
+        # Run logs request in separate thread. Can start it before because it'll wait 5 seconds for the
+        # calls request to begin.
+        logs_future = None
+        if stream_logs:
+            logs_future = _submit_call_logs(
+                thread_coroutine,
+                self._alogs_request(
+                    run_name=run_name,
+                    key=key,
+                    serialization=serialization,
+                    error_str=error_str,
+                    create_async_client=True,
+                ),
+            )
+
+        try:
             response = retry_with_exponential_backoff(session.post)(
                 self._formatted_url(f"{key}/{method_name}"),
                 json=CallParams(
@@ -477,18 +601,22 @@ class HTTPClient:
                     f"Error calling {method_name} on server: {response.content.decode()}"
                 )
 
-            resp_json = response.json()
+            resp_json = _json_loads(response.content)
+            output_type = resp_json["output_type"]
             function_result = handle_response(
                 resp_json,
-                resp_json["output_type"],
+                output_type,
                 error_str,
                 log_formatter=self.log_formatter,
             )
-            output_type = resp_json["output_type"]
-            if stream_logs:
+            if logs_future is not None:
                 _ = logs_future.result()
+        finally:
+            # Let the logs for this call finish streaming before returning, even if the call failed
+            if logs_future is not None:
+                wait([logs_future])
 
-        end = time.time()
+        end = time.perf_counter()
 
         function_result = self._process_call_result(
             function_result, system, output_type
@@ -561,7 +689,7 @@ class HTTPClient:
                 f"Error calling {method_name} on server: {response.content.decode()}"
             )
 
-        resp_json = response.json()
+        resp_json = _json_loads(response.content)
         return resp_json
 
     async def _alogs_request(
@@ -589,37 +717,42 @@ class HTTPClient:
         if error_str is None:
             error_str = f"Error calling logs function on server for {run_name}"
 
-        async with client.stream(
-            "POST",
-            self._formatted_url("logs"),
-            headers=self._request_headers,
-            json=LogsParams(
-                run_name=run_name,
-                node_ip_or_idx=node_ip_or_idx,
-                process=process,
-                key=key,
-                serialization=serialization,
-            ).model_dump(),
-        ) as res:
-            if res.status_code != 200:
-                error_resp = await res.aread()
-                raise ValueError(
-                    f"Error calling logs function on server: {error_resp.decode()}"
-                )
-            async for response_json in res.aiter_lines():
-                resp = json.loads(response_json)
-                output_type = resp["output_type"]
-                if output_type not in [
-                    OutputType.EXCEPTION,
-                    OutputType.STDOUT,
-                    OutputType.STDERR,
-                ]:
+        try:
+            async with client.stream(
+                "POST",
+                self._formatted_url("logs"),
+                headers=self._request_headers,
+                json=LogsParams(
+                    run_name=run_name,
+                    node_ip_or_idx=node_ip_or_idx,
+                    process=process,
+                    key=key,
+                    serialization=serialization,
+                ).model_dump(),
+            ) as res:
+                if res.status_code != 200:
+                    error_resp = await res.aread()
                     raise ValueError(
-                        f"Unexpected output type from logs function: {output_type}"
+                        f"Error calling logs function on server: {error_resp.decode()}"
                     )
-                handle_response(
-                    resp, output_type, error_str, log_formatter=self.log_formatter
-                )
+                async for response_json in res.aiter_lines():
+                    resp = _json_loads(response_json)
+                    output_type = resp["output_type"]
+                    if output_type not in [
+                        OutputType.EXCEPTION,
+                        OutputType.STDOUT,
+                        OutputType.STDERR,
+                    ]:
+                        raise ValueError(
+                            f"Unexpected output type from logs function: {output_type}"
+                        )
+                    handle_response(
+                        resp, output_type, error_str, log_formatter=self.log_formatter
+                    )
+        finally:
+            # A client created for this call (in another thread's event loop) would otherwise leak its connections
+            if create_async_client:
+                await client.aclose()
 
     async def acall_module_method(
         self,
@@ -645,7 +778,7 @@ class HTTPClient:
             )
 
         # Measure the time it takes to send the message
-        start = time.time()
+        start = time.perf_counter()
         logger.info(
             f"{'Calling' if method_name else 'Getting'} {key}"
             + (f".{method_name}" if method_name else "")
@@ -681,15 +814,15 @@ class HTTPClient:
             resp_json = await fut_result
             # alogs_request returns None, acall_request returns a legitimate result
             if resp_json is not None:
+                output_type = resp_json["output_type"]
                 function_result = handle_response(
                     resp_json,
-                    resp_json["output_type"],
+                    output_type,
                     error_str,
                     log_formatter=self.log_formatter,
                 )
-                output_type = resp_json["output_type"]
 
-        end = time.time()
+        end = time.perf_counter()
 
         function_result = self._process_call_result(
             function_result, system, output_type
@@ -717,6 +850,22 @@ class HTTPClient:
             err_str=f"Error putting object {key}",
         )
 
+    def put_objects(self, objects: Dict[str, Any], process=None):
+        """Put several objects in a single request, rather than one request per key."""
+        return self.request_json(
+            "objects",
+            req_type="post",
+            json_dict=PutObjectsParams(
+                serialized_data={
+                    key: serialize_data(value, "pickle")
+                    for key, value in objects.items()
+                },
+                process_name=process,
+                serialization="pickle",
+            ).model_dump(),
+            err_str=lambda: f"Error putting objects {list(objects)}",
+        )
+
     def put_resource(
         self, resource, process: Optional[str] = None, state=None, dryrun=False
     ):
@@ -759,7 +908,7 @@ class HTTPClient:
                 res = Resource.from_config(res, dryrun=True)
 
         except KeyError as e:
-            if default == KeyError:
+            if default is KeyError:
                 raise e
             return default
         return res
@@ -800,7 +949,7 @@ class HTTPClient:
             "delete_object",
             req_type="post",
             json_dict=DeleteObjectParams(keys=keys or []).model_dump(),
-            err_str=f"Error deleting keys {keys}",
+            err_str=lambda: f"Error deleting keys {keys}",
         )
 
     def keys(self, process=None):
@@ -58,6 +58,7 @@ from runhouse.servers.http.http_utils import (
     LogsParams,
     OutputType,
     PutObjectParams,
+    PutObjectsParams,
     PutResourceParams,
     RenameObjectParams,
     resolve_folder_path,
@@ -627,6 +628,28 @@ class HTTPServer:
                 from_http_server=True,
             )
 
+    @staticmethod
+    @app.post("/objects")
+    @validate_cluster_access
+    async def put_objects(request: Request, params: PutObjectsParams):
+        try:
+            for key, serialized_data in params.serialized_data.items():
+                await obj_store.aput(
+                    key=key,
+                    value=serialized_data,
+                    process=params.process_name,
+                    serialization=params.serialization,
+                    create_servlet_if_not_exists=True,
+                )
+            return Response(output_type=OutputType.SUCCESS)
+        except Exception as e:
+            return handle_exception_response(
+                e,
+                traceback.format_exc(),
+                serialization=params.serialization,
+                from_http_server=True,
+            )
+
     @staticmethod
     @app.get("/object")
     @validate_cluster_access
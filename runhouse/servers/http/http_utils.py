@@ -1,10 +1,10 @@
-import codecs
+import base64
 import json
 import re
 import shutil
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import requests
 
@@ -19,6 +19,9 @@ from runhouse.utils import ClusterLogsFormatter
 
 logger = get_logger(__name__)
 
+# Regex to match tqdm progress bars
+TQDM_REGEX = re.compile(r"(.+)%\|(.+)\|\s+(.+)/(.+)")
+
 
 class RequestContext(BaseModel):
     request_id: str
@@ -82,6 +85,12 @@ class PutObjectParams(BaseModel):
     process_name: Optional[str] = None
 
 
+class PutObjectsParams(BaseModel):
+    serialized_data: Dict[str, Any]
+    serialization: Optional[str] = None
+    process_name: Optional[str] = None
+
+
 class GetObjectParams(BaseModel):
     key: str
     serialization: Optional[str] = None
@@ -173,13 +182,15 @@ class FolderMvParams(FolderParams):
 def pickle_b64(picklable):
     import cloudpickle
 
-    return codecs.encode(cloudpickle.dumps(picklable), "base64").decode()
+    # b64encode does a single C pass, unlike the "base64" codec which wraps lines every 76 chars in Python. The
+    # decoder skips newlines, so payloads from either encoding round trip.
+    return base64.b64encode(cloudpickle.dumps(picklable)).decode()
 
 
 def b64_unpickle(b64_pickled):
     import cloudpickle
 
-    return cloudpickle.loads(codecs.decode(b64_pickled.encode(), "base64"))
+    return cloudpickle.loads(base64.b64decode(b64_pickled))
 
 
 def deserialize_data(data: Any, serialization: Optional[str]):
@@ -307,7 +318,7 @@ def load_current_cluster_rns_address():
 def handle_response(
     response_data: Dict[Any, Any],
     output_type: OutputType,
-    err_str: str,
+    err_str: Union[str, Callable[[], str], None],
     log_formatter: ClusterLogsFormatter,
 ):
     system_color, reset_color = log_formatter.format_server_log(output_type)
@@ -317,7 +328,12 @@ def handle_response(
     elif output_type == OutputType.CONFIG:
         # No need to unpickle since this was just sent as json
         return response_data["data"]
-    elif output_type == OutputType.CANCELLED:
+
+    # The error string may be passed as a callable so it's only built if it's actually needed
+    if callable(err_str):
+        err_str = err_str()
+
+    if output_type == OutputType.CANCELLED:
         raise RuntimeError(f"{err_str}: task was cancelled")
     elif output_type == OutputType.SUCCESS:
         return
@@ -363,17 +379,16 @@ def handle_response(
         raise fn_exception
     elif output_type == OutputType.STDOUT:
         res = response_data["data"]
-        # Regex to match tqdm progress bars
-        tqdm_regex = re.compile(r"(.+)%\|(.+)\|\s+(.+)/(.+)")
+        # Build the whole batch of lines and write it to stdout at once, rather than flushing once per line
+        output = []
         for line in res:
-            if tqdm_regex.match(line):
+            if TQDM_REGEX.match(line):
                 # tqdm lines are always preceded by a \n, so we can use \x1b[1A to move the cursor up one line
                 # For some reason, doesn't work in PyCharm's console, but works in the terminal
-                print(
-                    f"{system_color}\x1b[1A\r" + line + reset_color, end="", flush=True
-                )
+                output.append(f"{system_color}\x1b[1A\r" + line + reset_color)
             else:
-                print(system_color + line + reset_color, end="", flush=True)
+                output.append(system_color + line + reset_color)
+        print("".join(output), end="", flush=True)
     elif output_type == OutputType.STDERR:
         res = response_data["data"]
         print(system_color + res + reset_color, file=sys.stderr)
@@ -2,6 +2,7 @@ import asyncio
 import copy
 import os
 import threading
+from collections import deque
 from typing import Any, Dict, Optional
 
 import psutil
@@ -11,7 +12,6 @@ from runhouse.constants import (
     GPU_COLLECTION_INTERVAL,
     INCREASED_GPU_COLLECTION_INTERVAL,
     MAX_GPU_INFO_LEN,
-    REDUCED_GPU_INFO_LEN,
 )
 
 from runhouse.globals import obj_store
@@ -106,7 +106,10 @@ class NodeServlet:
                 gpu_count = pynvml.nvmlDeviceGetCount()
                 with self.lock:
                     if not self.gpu_metrics:
-                        self.gpu_metrics = {device: [] for device in range(gpu_count)}
+                        self.gpu_metrics = {
+                            device: deque(maxlen=MAX_GPU_INFO_LEN)
+                            for device in range(gpu_count)
+                        }
 
                     for gpu_index in range(gpu_count):
                         handle = pynvml.nvmlDeviceGetHandleByIndex(gpu_index)
@@ -119,13 +122,10 @@ class NodeServlet:
                         utilization_percent = float(util_info.gpu)
 
                         # to reduce cluster memory usage (we are saving the gpu_usage info on the cluster),
-                        # we save only the most updated gpu usage. If for some reason the size of updated_gpu_info is
-                        # too big, we remove the older gpu usage info.
+                        # we save only the most updated gpu usage. Once MAX_GPU_INFO_LEN samples are saved, the oldest
+                        # one is dropped as a new one is appended.
                         # This is relevant when using cluster.status() directly and not relying on status being sent to den.
-                        updated_gpu_info = self.gpu_metrics[gpu_index]
-                        if len(updated_gpu_info) + 1 > MAX_GPU_INFO_LEN:
-                            updated_gpu_info = updated_gpu_info[REDUCED_GPU_INFO_LEN:]
-                        updated_gpu_info.append(
+                        self.gpu_metrics[gpu_index].append(
                             {
                                 "total_memory": total_memory,
                                 "used_memory": used_memory,
@@ -133,7 +133,6 @@ class NodeServlet:
                                 "utilization_percent": utilization_percent,
                             }
                         )
-                        self.gpu_metrics[gpu_index] = updated_gpu_info
 
             except Exception as e:
                 logger.error(
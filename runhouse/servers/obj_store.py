@@ -5,9 +5,10 @@ import logging
 import os
 import sys
 import time
+import types
 import uuid
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 
@@ -116,23 +117,47 @@ def get_cluster_servlet(
     return cluster_servlet
 
 
+# These types can't be subclassed, so an exact type lookup matches inspect.iscoroutine / isgenerator / isasyncgen
+_LAZINESS_TYPES = {
+    types.CoroutineType: "coroutine",
+    types.GeneratorType: "generator",
+    types.AsyncGeneratorType: "async generator",
+}
+
+
+@lru_cache(maxsize=1)
+def _cuda_visible_devices() -> str:
+    # Only query the GCS for the GPU count once per process; re-initializations of the obj_store reuse it
+    import ray
+
+    num_gpus = int(ray.cluster_resources().get("GPU", 0))
+    return ",".join(map(str, range(num_gpus)))
+
+
+@lru_cache(maxsize=256)
+def _type_name(cls: type) -> str:
+    # Bounded, since modules re-sent to the cluster define new classes each time
+    py_module = cls.__module__
+    return (
+        cls.__qualname__
+        if py_module == "builtins"
+        else f"{py_module}.{cls.__qualname__}"
+    )
+
+
 def context_wrapper(func):
     @wraps(func)
     async def wrapper(self, *args, **kwargs):
         ctx_token = None
-        try:
-            if not req_ctx.get():
-                ctx_token = await self.apopulate_ctx_locally()
+        if not req_ctx.get():
+            ctx_token = await self.apopulate_ctx_locally()
 
-            res = await func(self, *args, **kwargs)
-        except Exception as e:
-            raise e
+        try:
+            return await func(self, *args, **kwargs)
         finally:
             if ctx_token:
                 self.unset_ctx(ctx_token)
 
-        return res
-
     return wrapper
 
 
@@ -261,21 +286,33 @@ class ObjStore:
         if self.has_local_storage:
             self._kv_store = {}
 
-        # Store a local copy of the cluster_config here
-        self.cluster_config = await self.aget_cluster_config(refresh=True)
+        # Store a local copy of the cluster_config here, and fetch the rest of the state new processes need in the
+        # same round trip
+        if self.cluster_servlet is not None:
+            (
+                self.cluster_config,
+                paths_to_prepend,
+                env_vars_to_set,
+            ) = await self._abatch_cluster_servlet_calls(
+                [
+                    ("aget_cluster_config", (), {}),
+                    ("aget_paths_to_prepend_in_new_processes", (), {}),
+                    ("aget_env_vars_to_set_in_new_processes", (), {}),
+                ]
+            )
+        else:
+            self.cluster_config = await self.aget_cluster_config(refresh=True)
+            paths_to_prepend = await self.aget_paths_to_prepend_in_new_processes()
+            env_vars_to_set = await self.aget_env_vars_to_set_in_new_processes()
 
-        num_gpus = ray.cluster_resources().get("GPU", 0)
-        cuda_visible_devices = list(range(int(num_gpus)))
-        os.environ["CUDA_VISIBLE_DEVICES"] = ",".join(map(str, cuda_visible_devices))
+        os.environ["CUDA_VISIBLE_DEVICES"] = _cuda_visible_devices()
 
         # Add to the sys.path the path that you need to prepend
-        paths_to_prepend = await self.aget_paths_to_prepend_in_new_processes()
         for path in paths_to_prepend:
             if path not in sys.path:
                 sys.path.insert(0, path)
 
         # Set env vars that need to be set on creation
-        env_vars_to_set = await self.aget_env_vars_to_set_in_new_processes()
         self.set_process_env_vars_local(env_vars_to_set)
 
         # Set env vars that were passed in initialization, these should override
@@ -505,6 +542,10 @@ class ObjStore:
 
             raise e
 
+    async def _abatch_cluster_servlet_calls(self, ops: List[tuple]) -> List[Any]:
+        """Make several ClusterServlet calls, given as (method_name, args, kwargs) tuples, in one round trip."""
+        return await self.acall_actor_method(self.cluster_servlet, "abatch", ops)
+
     @staticmethod
     async def acall_actor_method(
         actor: "ray.actor.ActorHandle", method: str, *args, **kwargs
@@ -687,7 +728,9 @@ class ObjStore:
     # Cluster config state storage methods
     ##############################################
     async def aget_cluster_config(self, refresh: bool = False):
-        if refresh or not self.cluster_config:
+        # The local copy is kept current by the ClusterServlet, which pushes config changes to every process's
+        # obj_store, so only fetch it if we've never loaded it (an empty config is still a loaded one)
+        if refresh or self.cluster_config is None:
             if self.cluster_servlet is not None:
                 self.cluster_config = await self.acall_actor_method(
                     self.cluster_servlet, "aget_cluster_config"
@@ -698,6 +741,10 @@ class ObjStore:
         return self.cluster_config
 
     def get_cluster_config(self):
+        # Serve the local copy directly rather than spinning up a thread and event loop just to return it. This is
+        # also called from within async methods (e.g. via get_internal_ips), where it shouldn't block the loop.
+        if self.cluster_config is not None:
+            return self.cluster_config
         return sync_function(self.aget_cluster_config)()
 
     async def aset_cluster_config(self, config: Dict[str, Any]):
@@ -735,7 +782,6 @@ class ObjStore:
     async def ahas_resource_access(self, token: str, resource_uri=None) -> bool:
         """Checks whether user has read or write access to a given module saved on the cluster."""
         from runhouse.globals import configs, rns_client
-        from runhouse.rns.utils.api import ResourceAccess
         from runhouse.servers.http.http_utils import load_current_cluster_rns_address
 
         if token is None:
@@ -756,26 +802,15 @@ class ObjStore:
             ):
                 return True
 
+        # Check the cluster and then (if needed) the resource access level in a single ClusterServlet round trip
         cluster_uri = load_current_cluster_rns_address()
-        cluster_access = await self.aresource_access_level(token, cluster_uri)
-        if cluster_access == ResourceAccess.WRITE:
-            # if user has write access to cluster will have access to all resources
-            return True
-
-        if resource_uri != cluster_uri and cluster_access == ResourceAccess.READ:
-            # If the user has READ access to the cluster and this isn't a cluster management
-            # endpoint, they have access to all resources
-            return True
-
-        if resource_uri is None and cluster_access not in [
-            ResourceAccess.WRITE,
-            ResourceAccess.READ,
-        ]:
-            # If module does not have a name, must have access to the cluster
-            return False
-
-        resource_access_level = await self.aresource_access_level(token, resource_uri)
-        return resource_access_level in [ResourceAccess.WRITE, ResourceAccess.READ]
+        return await self.acall_actor_method(
+            self.cluster_servlet,
+            "ahas_resource_access",
+            token,
+            cluster_uri,
+            resource_uri,
+        )
 
     async def aclear_auth_cache(self, token: str = None):
         return await self.acall_actor_method(
@@ -939,10 +974,15 @@ class ObjStore:
                     f"Process {process} does not exist; cannot put key {key} there."
                 )
 
-        # If it does exist somewhere, no more!
-        if await self.aget(key, default=None) is not None:
+        # If it does exist somewhere, no more! We only need to know where it lives, not fetch its value.
+        if self.contains_local(key):
             logger.warning("Key already exists in some process, overwriting.")
-            await self.apop(key)
+            await self.adelete_local(key)
+        else:
+            servlet_name_containing_key = await self.aget_servlet_name_for_key(key)
+            if servlet_name_containing_key is not None:
+                logger.warning("Key already exists in some process, overwriting.")
+                await self.adelete_for_servlet_name(servlet_name_containing_key, key)
 
         if self.has_local_storage and process == self.servlet_name:
             if serialization is not None:
@@ -976,7 +1016,8 @@ class ObjStore:
         serialization: Optional[str] = None,
         remote: bool = False,
     ):
-        logger.info(f"Getting {key} from servlet {servlet_name}")
+        # Let logging format this only if it's actually emitted, keys can have expensive reprs
+        logger.info("Getting %s from servlet %s", key, servlet_name)
         return await self.acall_servlet_method(
             servlet_name,
             "aget_local",
@@ -1011,11 +1052,11 @@ class ObjStore:
                         )
                 return res
             except KeyError as e:
-                if default == KeyError:
+                if default is KeyError:
                     raise e
                 return default
         else:
-            if default == KeyError:
+            if default is KeyError:
                 raise KeyError(f"No local store exists; key {key} not found.")
             return default
 
@@ -1026,10 +1067,14 @@ class ObjStore:
         remote: bool = False,
         default: Optional[Any] = None,
     ):
-        servlet_name_containing_key = await self.aget_servlet_name_for_key(key)
+        if self.contains_local(key):
+            # Keys in the local store are always mapped to this process, so we don't need to ask the ClusterServlet
+            servlet_name_containing_key = self.servlet_name
+        else:
+            servlet_name_containing_key = await self.aget_servlet_name_for_key(key)
 
         if not servlet_name_containing_key:
-            if default == KeyError:
+            if default is KeyError:
                 raise KeyError(f"No local store exists; key {key} not found.")
             return default
 
@@ -1218,10 +1263,13 @@ class ObjStore:
         keys_to_delete = [key] if isinstance(key, str) else key
         deleted_keys = []
 
+        initialized_servlet_names = await self.aget_all_initialized_servlet_args()
         for key_to_delete in keys_to_delete:
-            if key_to_delete in await self.aget_all_initialized_servlet_args():
+            if key_to_delete in initialized_servlet_names:
                 deleted_keys += await self.adelete_servlet_contents(key_to_delete)
 
+        remote_keys = []
+        for key_to_delete in keys_to_delete:
             if key_to_delete in deleted_keys:
                 continue
 
@@ -1229,16 +1277,29 @@ class ObjStore:
                 await self.adelete_local(key_to_delete)
                 deleted_keys.append(key_to_delete)
             else:
-                servlet_name = await self.aget_servlet_name_for_key(key_to_delete)
-                if servlet_name == self.servlet_name and self.has_local_storage:
-                    raise ObjStoreError(
-                        "Key not found in kv store despite servlet specifying that it is here."
-                    )
-                if servlet_name is None:
-                    raise KeyError(f"Key {key} not found in any process.")
+                remote_keys.append(key_to_delete)
 
-                await self.adelete_for_servlet_name(servlet_name, key_to_delete)
-                deleted_keys.append(key_to_delete)
+        if not remote_keys:
+            return
+
+        # Look up where all the remaining keys live in one round trip, then delete them concurrently
+        servlet_names = await self._abatch_cluster_servlet_calls(
+            [("aget_servlet_name_for_key", (k,), {}) for k in remote_keys]
+        )
+        for key_to_delete, servlet_name in zip(remote_keys, servlet_names):
+            if servlet_name == self.servlet_name and self.has_local_storage:
+                raise ObjStoreError(
+                    "Key not found in kv store despite servlet specifying that it is here."
+                )
+            if servlet_name is None:
+                raise KeyError(f"Key {key_to_delete} not found in any process.")
+
+        await asyncio.gather(
+            *[
+                self.adelete_for_servlet_name(servlet_name, key_to_delete)
+                for key_to_delete, servlet_name in zip(remote_keys, servlet_names)
+            ]
+        )
 
     def delete(self, key: Union[Any, List[Any]]):
         return sync_function(self.adelete)(key)
@@ -1251,18 +1312,27 @@ class ObjStore:
 
     async def aclear_local(self):
         if self.has_local_storage:
-            # Use asyncio gather to run all the deletes concurrently
-            await asyncio.gather(
-                *[self.apop_local(k) for k in list(self._kv_store.keys())]
+            keys = list(self._kv_store.keys())
+            self._kv_store.clear()
+            # Remove all the keys from the global key to process mapping in one round trip
+            await self.acall_actor_method(
+                self.cluster_servlet,
+                "apop_servlet_name_for_keys",
+                keys,
+                self.servlet_name,
             )
 
     async def aclear(self):
         logger.warning("Clearing all keys from all servlets in the object store!")
-        for servlet_name in await self.aget_all_initialized_servlet_args():
-            if servlet_name == self.servlet_name and self.has_local_storage:
-                await self.aclear_local()
-            else:
-                await self.aclear_for_servlet_name(servlet_name)
+        # Clear all the servlets concurrently so the round trips overlap
+        await asyncio.gather(
+            *[
+                self.aclear_local()
+                if servlet_name == self.servlet_name and self.has_local_storage
+                else self.aclear_for_servlet_name(servlet_name)
+                for servlet_name in await self.aget_all_initialized_servlet_args()
+            ]
+        )
 
     def clear(self):
         return sync_function(self.aclear)()
@@ -1434,15 +1504,18 @@ class ObjStore:
                         f"Unauthorized access to resource {key}.",
                     )
 
-        # Process any inputs which need to be resolved
-        args = [
-            arg.fetch() if (isinstance(arg, Module) and arg._resolve) else arg
-            for arg in args
-        ]
-        kwargs = {
-            k: v.fetch() if (isinstance(v, Module) and v._resolve) else v
-            for k, v in kwargs.items()
-        }
+        # Process any inputs which need to be resolved, skipping the rebuild entirely for the common case of calls
+        # with no Module inputs
+        if any(isinstance(arg, Module) for arg in args):
+            args = [
+                arg.fetch() if (isinstance(arg, Module) and arg._resolve) else arg
+                for arg in args
+            ]
+        if any(isinstance(v, Module) for v in kwargs.values()):
+            kwargs = {
+                k: v.fetch() if (isinstance(v, Module) and v._resolve) else v
+                for k, v in kwargs.items()
+            }
 
         method_name = method_name or "__call__"
 
@@ -1511,15 +1584,7 @@ class ObjStore:
                 )
                 res = method
 
-        laziness_type = (
-            "coroutine"
-            if inspect.iscoroutine(res)
-            else "generator"
-            if inspect.isgenerator(res)
-            else "async generator"
-            if inspect.isasyncgen(res)
-            else None
-        )
+        laziness_type = _LAZINESS_TYPES.get(type(res))
 
         if laziness_type:
             # If the result is a coroutine or generator, we can't return it over the process boundary
@@ -1532,8 +1597,6 @@ class ObjStore:
             await self.aput_local(run_name, fut)
             return fut
 
-        from runhouse.resources.resource import Resource
-
         if isinstance(res, Resource):
             if run_name and "--" not in run_name:
                 # This is a user-specified name, so we want to override the existing name with it
@@ -1585,7 +1648,11 @@ class ObjStore:
         stream_logs: bool = False,
         remote: bool = False,
     ):
-        servlet_name_containing_key = await self.aget_servlet_name_for_key(key)
+        if self.contains_local(key):
+            # Keys in the local store are always mapped to this process, so we don't need to ask the ClusterServlet
+            servlet_name_containing_key = self.servlet_name
+        else:
+            servlet_name_containing_key = await self.aget_servlet_name_for_key(key)
         if not servlet_name_containing_key:
             raise ObjStoreError(
                 f"Key {key} not found in any process, cannot call method {method_name} on it."
@@ -1796,31 +1863,66 @@ class ObjStore:
     ##############################################
     # Get several keys for function initialization utilities
     ##############################################
-    async def aget_list(self, keys: List[str], default: Optional[Any] = None):
-        return await asyncio.gather(
-            *[self.aget(key, default=default or key) for key in keys]
+    async def _aget_many(self, keys: List[Any], defaults: List[Any]) -> List[Any]:
+        """Get several keys, each with its own default. Keys held locally are read directly, the processes holding
+        the rest are looked up in a single ClusterServlet round trip, and those values are then fetched concurrently."""
+        results = [None] * len(keys)
+        remote_indices = []
+        for i, key in enumerate(keys):
+            if self.contains_local(key):
+                results[i] = self.get_local(key, default=defaults[i])
+            else:
+                remote_indices.append(i)
+
+        if not remote_indices:
+            return results
+
+        servlet_names = await self._abatch_cluster_servlet_calls(
+            [("aget_servlet_name_for_key", (keys[i],), {}) for i in remote_indices]
         )
 
+        fetches = {}
+        for i, servlet_name in zip(remote_indices, servlet_names):
+            if not servlet_name or (
+                servlet_name == self.servlet_name and self.has_local_storage
+            ):
+                results[i] = defaults[i]
+            else:
+                fetches[i] = self.aget_from_servlet_name(
+                    servlet_name, keys[i], default=defaults[i]
+                )
+
+        for i, res in zip(fetches.keys(), await asyncio.gather(*fetches.values())):
+            results[i] = res
+
+        return results
+
+    async def aget_list(self, keys: List[str], default: Optional[Any] = None):
+        return await self._aget_many(keys, [default or key for key in keys])
+
     def get_list(self, keys: List[str], default: Optional[Any] = None):
         return sync_function(self.aget_list)(keys, default)
 
     async def aget_obj_refs_list(self, keys: List[Any]):
-
-        return await asyncio.gather(
-            *[
-                self.aget(key, default=key) if isinstance(key, str) else key
-                for key in keys
-            ]
-        )
+        # Only string keys can be references to objects in the store
+        res = list(keys)
+        ref_indices = [i for i, key in enumerate(keys) if isinstance(key, str)]
+        ref_keys = [keys[i] for i in ref_indices]
+        for i, val in zip(ref_indices, await self._aget_many(ref_keys, ref_keys)):
+            res[i] = val
+        return res
 
     def get_obj_refs_list(self, keys: List[Any]):
         return sync_function(self.aget_obj_refs_list)(keys)
 
     async def aget_obj_refs_dict(self, d: Dict[Any, Any]):
-        return {
-            k: await self.aget(v, default=v) if isinstance(v, str) else v
-            for k, v in d.items()
-        }
+        # Only string values can be references to objects in the store
+        res = dict(d)
+        ref_items = [(k, v) for k, v in d.items() if isinstance(v, str)]
+        ref_keys = [v for _, v in ref_items]
+        for (k, _), val in zip(ref_items, await self._aget_many(ref_keys, ref_keys)):
+            res[k] = val
+        return res
 
     def get_obj_refs_dict(self, d: Dict[Any, Any]):
         return sync_function(self.aget_obj_refs_dict)(d)
@@ -1841,16 +1943,12 @@ class ObjStore:
 
         process = process or self.servlet_name
         if self.has_local_storage and process == self.servlet_name:
-            resource_config, state, dryrun = tuple(
-                deserialize_data(serialized_data, serialization)
+            resource_config, state, dryrun = deserialize_data(
+                serialized_data, serialization
             )
             return await self.aput_resource_local(resource_config, state, dryrun)
 
-        # Normally, serialization and deserialization happens within the servlet
-        # However, if we're putting a process, we need to deserialize it here and
-        # actually create the corresponding env servlet.
-        resource_config, _, _ = tuple(deserialize_data(serialized_data, serialization))
-
+        # Serialization and deserialization happens within the servlet, so forward the payload as is
         return await self.acall_servlet_method(
             process,
             "aput_resource_local",
@@ -1878,20 +1976,21 @@ class ObjStore:
         from runhouse.resources.resource import Resource
 
         state = state or {}
-        # Resolve any sub-resources which are string references to resources already sent to this cluster.
-        # We need to pop the resource's own name so it doesn't get resolved if it's already present in the
-        # obj_store.
-        name = resource_config.pop("name")
-        subtype = resource_config.pop("resource_subtype")
-        provider = (
-            resource_config.pop("provider") if "provider" in resource_config else None
-        )
-
-        resource_config = await self.aget_obj_refs_dict(resource_config)
-        resource_config["name"] = name
-        resource_config["resource_subtype"] = subtype
-        if provider:
-            resource_config["provider"] = provider
+        name = resource_config["name"]
+        if "provider" in resource_config and not resource_config["provider"]:
+            del resource_config["provider"]
+
+        # Resolve any sub-resources which are string references to resources already sent to this cluster, in
+        # place. We need to skip the resource's own name (and its subtype and provider) so they don't get resolved
+        # if they're already present in the obj_store.
+        ref_fields = [
+            k
+            for k, v in resource_config.items()
+            if isinstance(v, str) and k not in ("name", "resource_subtype", "provider")
+        ]
+        ref_keys = [resource_config[k] for k in ref_fields]
+        for k, val in zip(ref_fields, await self._aget_many(ref_keys, ref_keys)):
+            resource_config[k] = val
 
         logger.debug(f"Message received from client to construct resource: {name}")
 
@@ -1921,25 +2020,18 @@ class ObjStore:
         # Need to copy to avoid race conditions
         current_active_function_calls = copy.copy(self.active_function_calls)
 
-        keys_and_info = {}
-        for k, v in self._kv_store.items():
-            cls = type(v)
-            py_module = cls.__module__
-            cls_name = (
-                cls.__qualname__
-                if py_module == "builtins"
-                else (py_module + "." + cls.__qualname__)
-            )
-
-            active_fn_calls = [
+        # Group the active calls by key in one pass, rather than scanning all of them for every key
+        active_fn_calls_by_key = {}
+        for call_info in current_active_function_calls.values():
+            active_fn_calls_by_key.setdefault(call_info.key, []).append(
                 call_info.model_dump()
-                for call_info in current_active_function_calls.values()
-                if call_info.key == k
-            ]
+            )
 
+        keys_and_info = {}
+        for k, v in self._kv_store.items():
             keys_and_info[k] = {
-                "resource_type": cls_name,
-                "active_function_calls": active_fn_calls,
+                "resource_type": _type_name(type(v)),
+                "active_function_calls": active_fn_calls_by_key.get(k, []),
             }
 
         return keys_and_info
@@ -4,6 +4,7 @@ import sys
 import threading
 import time
 import traceback
+from collections import deque
 from functools import wraps
 from typing import Any, Dict, Optional
 
@@ -13,7 +14,6 @@ from runhouse.constants import (
     DEFAULT_STATUS_CHECK_INTERVAL,
     GPU_COLLECTION_INTERVAL,
     MAX_GPU_INFO_LEN,
-    REDUCED_GPU_INFO_LEN,
 )
 
 from runhouse.globals import obj_store
@@ -306,8 +306,10 @@ class Servlet:
         )
 
     def _get_process_gpu_usage(self):
-
-        collected_gpus_info = copy.deepcopy(self.gpu_metrics)
+        # The collector thread appends to (and evicts from) the per-gpu deques under the lock, and copying a deque
+        # while it's being mutated raises
+        with self.lock:
+            collected_gpus_info = copy.deepcopy(self.gpu_metrics)
 
         if not collected_gpus_info or not collected_gpus_info.get(0):
             return None
@@ -327,8 +329,9 @@ class Servlet:
                 gpu_count = pynvml.nvmlDeviceGetCount()
                 with self.lock:
                     if not self.gpu_metrics:
-                        self.gpu_metrics: Dict[int, list[Dict[str, int]]] = {
-                            device: [] for device in range(gpu_count)
+                        self.gpu_metrics: Dict[int, deque[Dict[str, int]]] = {
+                            device: deque(maxlen=MAX_GPU_INFO_LEN)
+                            for device in range(gpu_count)
                         }
 
                     for gpu_index in range(gpu_count):
@@ -342,24 +345,16 @@ class Servlet:
                                 if p.pid == self.pid:
                                     used_memory = p.usedGpuMemory  # in bytes
                                     total_memory = memory_info.total  # in bytes
-                                    current_gpu_metrics: list[
-                                        Dict[str, int]
-                                    ] = self.gpu_metrics[gpu_index]
                                     # to reduce cluster memory usage (we are saving the gpu_usage info on the cluster),
-                                    # we save only the most updated gpu usage. If for some reason the size of updated_gpu_info is
-                                    # too big, we remove the older gpu usage info.
+                                    # we save only the most updated gpu usage. Once MAX_GPU_INFO_LEN samples are saved,
+                                    # the oldest one is dropped as a new one is appended.
                                     # This is relevant when using cluster.status() directly and not relying on status being sent to den.
-                                    if len(current_gpu_metrics) + 1 > MAX_GPU_INFO_LEN:
-                                        current_gpu_metrics = current_gpu_metrics[
-                                            REDUCED_GPU_INFO_LEN:
-                                        ]
-                                    current_gpu_metrics.append(
+                                    self.gpu_metrics[gpu_index].append(
                                         {
                                             "used_memory": used_memory,
                                             "total_memory": total_memory,
                                         }
                                     )
-                                    self.gpu_metrics[gpu_index] = current_gpu_metrics
             except Exception as e:
                 logger.error(str(e))
                 pynvml.nvmlShutdown()
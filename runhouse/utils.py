@@ -1,4 +1,5 @@
 import asyncio
+import codecs
 import contextvars
 import functools
 
@@ -6,20 +7,22 @@ import importlib.metadata as metadata
 
 import inspect
 import json
+import locale
 import logging
 import os
 import re
+import selectors
 import shlex
 import subprocess
 import sys
 import tempfile
 import threading
-import uuid
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from io import SEEK_SET, StringIO
 from itertools import cycle
+from operator import itemgetter
 from pathlib import Path
 from time import sleep
 from typing import Callable, Dict, Optional, Type, Union
@@ -33,21 +36,28 @@ from runhouse.logger import get_logger, init_logger
 
 logger = get_logger(__name__)
 
+_PACKAGE_STRING_RE = re.compile(r"^[a-zA-Z0-9\._-]+$")
+_PIP_EXTRAS_RE = re.compile(
+    r"^(?P<package>[a-zA-Z0-9][a-zA-Z0-9\._-]*)(?:\[(?P<extras>[-a-zA-Z0-9\._,]+)\])?$"
+)
+_ANSI_ESCAPE_RE = re.compile(r"(?:\x1B[@-_][0-?]*[ -/]*[@-~])")
+_PASSWORD_PROMPT_RE = re.compile(r"[Pp]assword:")
+
 
 def get_random_str(length: int = 8):
     if length > 32:
         raise ValueError("Max length of random string is 32")
 
-    return str(uuid.uuid4())[:length]
+    return os.urandom((length + 1) // 2).hex()[:length]
 
 
 ####################################################################################################
 # Simple env setup utilities
 ####################################################################################################
 def set_env_vars_in_current_process(env_vars: dict):
-    for k, v in env_vars.items():
-        if v is not None:
-            os.environ[k] = v
+    if not env_vars:
+        return
+    os.environ.update({k: v for k, v in env_vars.items() if v is not None})
 
 
 def conda_env_cmd(cmd, conda_env_name):
@@ -117,29 +127,23 @@ def create_conda_env_on_cluster(
 ):
     yaml_path = Path(ENVS_DIR) / f"{conda_env_name}.yml"
 
-    env_exists = (
-        f"\n{conda_env_name} "
-        in run_setup_command("conda info --envs", cluster=cluster, node=node)[1]
-    )
-    run_setup_command(f"mkdir -p {ENVS_DIR}", cluster=cluster, node=node)
-    yaml_exists = (
-        (Path(ENVS_DIR).expanduser() / f"{conda_env_name}.yml").exists()
-        if not cluster
-        else run_setup_command(f"ls {yaml_path}", cluster=cluster, node=node)[0] == 0
-    )
+    # Create the envs dir and check for both the yaml file and the env in a single round trip
+    yaml_exists_marker = "__RH_CONDA_YAML_EXISTS__"
+    env_check_output = run_setup_command(
+        f"mkdir -p {ENVS_DIR}; "
+        f"[ -f {yaml_path} ] && echo {yaml_exists_marker}; "
+        "conda info --envs",
+        cluster=cluster,
+        node=node,
+    )[1]
+    yaml_exists = yaml_exists_marker in env_check_output
+    env_exists = f"\n{conda_env_name} " in env_check_output
 
     if force or not (yaml_exists and env_exists):
         # dump config into yaml file on cluster
         if not cluster:
-            python_commands = "; ".join(
-                [
-                    "import yaml",
-                    "from pathlib import Path",
-                    f"path = Path('{ENVS_DIR}').expanduser()",
-                    f"yaml.dump({conda_config}, open(path / '{conda_env_name}.yml', 'w'))",
-                ]
-            )
-            subprocess.run(f'python3 -c "{python_commands}"', shell=True)
+            with open(yaml_path.expanduser(), "w") as f:
+                yaml.dump(conda_config, f)
         else:
             contents = yaml.dump(conda_config)
             run_setup_command(
@@ -182,6 +186,20 @@ def _process_env_vars(env_vars):
 ####################################################################################################
 # Python package utilities
 ####################################################################################################
+# Scanning ``distributions()`` re-reads every installed package's metadata from disk, so we build the
+# name -> local install path map once and reuse it until an install invalidates it.
+_local_install_paths: Optional[Dict[str, str]] = None
+_local_install_paths_lock = threading.Lock()
+
+
+def _clear_metadata_cache():
+    global _local_install_paths
+    with _local_install_paths_lock:
+        _local_install_paths = None
+    find_locally_installed_version.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
 def find_locally_installed_version(package_name: str) -> Optional[str]:
     try:
         return metadata.version(package_name)
@@ -189,32 +207,42 @@ def find_locally_installed_version(package_name: str) -> Optional[str]:
         return None
 
 
-def get_local_install_path(package_name: str) -> Optional[str]:
-    from importlib.metadata import distributions
-
-    for dist in distributions():
+def _build_local_install_paths() -> Dict[str, str]:
+    install_paths = {}
+    for dist in metadata.distributions():
         direct_url_json = dist.read_text("direct_url.json")
-        if direct_url_json and dist.metadata["Name"].lower() == package_name.lower():
-            try:
-                url = json.loads(direct_url_json).get("url", None)
-                if url:
-                    if url.startswith("file://"):
-                        return url[len("file://") :]
-            except json.JSONDecodeError:
-                pass
-    return None
+        if not direct_url_json:
+            continue
+        try:
+            url = json.loads(direct_url_json).get("url", None)
+        except json.JSONDecodeError:
+            continue
+        if url and url.startswith("file://"):
+            # Keep the first match, as the previous linear scan did
+            install_paths.setdefault(
+                dist.metadata["Name"].lower(), url[len("file://") :]
+            )
+    return install_paths
+
+
+def get_local_install_path(package_name: str) -> Optional[str]:
+    global _local_install_paths
+    install_paths = _local_install_paths
+    if install_paths is None:
+        with _local_install_paths_lock:
+            if _local_install_paths is None:
+                _local_install_paths = _build_local_install_paths()
+            install_paths = _local_install_paths
+    return install_paths.get(package_name.lower())
 
 
 def is_python_package_string(s: str) -> bool:
-    return isinstance(s, str) and re.match(r"^[a-zA-Z0-9\._-]+$", s) is not None
+    return isinstance(s, str) and _PACKAGE_STRING_RE.match(s) is not None
 
 
 def split_pip_extras(package: str):
     # check if package is in the form package[extras]
-    match = re.search(
-        r"^(?P<package>[a-zA-Z0-9][a-zA-Z0-9\._-]*)(?:\[(?P<extras>[-a-zA-Z0-9\._,]+)\])?$",
-        package,
-    )
+    match = _PIP_EXTRAS_RE.search(package)
     if match:
         return match.group("package"), match.group("extras")
     return package, None
@@ -239,54 +267,105 @@ def run_with_logs(cmd: str, **kwargs):
     require_outputs = kwargs.pop("require_outputs", False)
     stream_logs = kwargs.pop("stream_logs", True)
 
+    if not stream_logs and not require_outputs:
+        # Nothing will read the output, so let the kernel discard it instead of draining pipes
+        return subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            shell=True,
+            **kwargs,
+        ).returncode
+
+    if not stream_logs:
+        p = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            shell=True,
+            **kwargs,
+        )
+        stdout, stderr = p.communicate()
+        return p.returncode, stdout, stderr
+
     p = subprocess.Popen(
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
         shell=True,
         **kwargs,
     )
-
-    out = ""
-    if stream_logs:
-        while True:
-            line = p.stdout.readline()
-            if line == "" and p.poll() is not None:
-                break
-            sys.stdout.write(line)
-            sys.stdout.flush()
-            if require_outputs:
-                out += line
-
-    stdout, stderr = p.communicate()
+    stdout, stderr = _stream_process_output(p, require_outputs=require_outputs)
 
     if require_outputs:
-        stdout = stdout or out
         return p.returncode, stdout, stderr
 
     return p.returncode
 
 
+def _stream_process_output(p: subprocess.Popen, require_outputs: bool = False):
+    """Read a process's stdout and stderr in chunks straight off the pipe fds until both close, echoing
+    stdout to sys.stdout as it arrives. Both pipes are drained so a chatty stderr can't fill its buffer
+    and stall the process. Returns the decoded (stdout, stderr) if require_outputs, else empty strings."""
+    stdout_fd, stderr_fd = p.stdout.fileno(), p.stderr.fileno()
+    encoding = locale.getpreferredencoding(False)
+    decoders = {
+        fd: codecs.getincrementaldecoder(encoding)(errors="replace")
+        for fd in (stdout_fd, stderr_fd)
+    }
+    outputs = {stdout_fd: [], stderr_fd: []}
+
+    def _handle(fd, text):
+        if fd == stdout_fd and text:
+            # Write text rather than bytes, since sys.stdout may be a StreamTee teeing to log files
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        if require_outputs:
+            outputs[fd].append(text)
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(p.stdout, selectors.EVENT_READ)
+        selector.register(p.stderr, selectors.EVENT_READ)
+        while selector.get_map():
+            for key, _ in selector.select():
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    _handle(key.fd, decoders[key.fd].decode(b"", final=True))
+                    continue
+                _handle(key.fd, decoders[key.fd].decode(chunk))
+
+    p.stdout.close()
+    p.stderr.close()
+    p.wait()
+
+    return "".join(outputs[stdout_fd]), "".join(outputs[stderr_fd])
+
+
 ####################################################################################################
 # Module discovery and import logic
 ####################################################################################################
 
 
-def _find_directory_containing_any_file(dir_path, files, searched_dirs=None):
-    if Path(dir_path) == Path.home() or dir_path == Path("/"):
-        return None
-
-    if any(Path(dir_path, file).exists() for file in files):
-        return str(dir_path)
-
-    searched_dirs.add(dir_path)
-    parent_path = Path(dir_path).parent
-    if parent_path in searched_dirs:
-        return None
-    return _find_directory_containing_any_file(
-        parent_path, files, searched_dirs=searched_dirs
-    )
+def _find_directory_containing_any_file(dir_path, files):
+    # One directory listing per level instead of an exists() stat per target file
+    targets = set(files)
+    home = str(Path.home())
+    dir_path = os.path.normpath(dir_path)
+    while dir_path not in (home, "/"):
+        try:
+            with os.scandir(dir_path) as entries:
+                if any(entry.name in targets for entry in entries):
+                    return dir_path
+        except OSError:
+            pass
+
+        parent_path = os.path.dirname(dir_path)
+        if parent_path == dir_path:
+            return None
+        dir_path = parent_path
+    return None
 
 
 def locate_working_dir(start_dir=None):
@@ -302,29 +381,65 @@ def locate_working_dir(start_dir=None):
         "requirements.txt",
     ]
 
-    dir_with_target = _find_directory_containing_any_file(
-        start_dir, target_files, searched_dirs=set()
-    )
+    dir_with_target = _find_directory_containing_any_file(start_dir, target_files)
 
     if dir_with_target is None:
-        dir_with_target = _find_directory_containing_any_file(
-            start_dir, ["rh"], searched_dirs=set()
-        )
+        dir_with_target = _find_directory_containing_any_file(start_dir, ["rh"])
 
     return dir_with_target if dir_with_target is not None else start_dir
 
 
+@functools.lru_cache(maxsize=None)
+def _resolved_module_file(module_file: str) -> str:
+    return str(Path(module_file).resolve())
+
+
+def _module_path(py_module) -> Optional[str]:
+    if not hasattr(py_module, "__file__"):
+        return None
+
+    module_file = inspect.getfile(py_module)
+    # Need to resolve in case just filename is given. Absolute files resolve the same way for the life of
+    # the process, so only those are cached.
+    if os.path.isabs(module_file):
+        return _resolved_module_file(module_file)
+    return str(Path(module_file).resolve())
+
+
 def extract_module_path(raw_cls_or_fn: Union[Type, Callable]):
-    py_module = inspect.getmodule(raw_cls_or_fn)
+    return _module_path(inspect.getmodule(raw_cls_or_fn))
 
-    # Need to resolve in case just filename is given
-    module_path = (
-        str(Path(inspect.getfile(py_module)).resolve())
-        if hasattr(py_module, "__file__")
-        else None
-    )
 
-    return module_path
+@functools.lru_cache(maxsize=None)
+def _module_root_and_name(py_module, module_path: str):
+    """Root path and importable module name for a module loaded from ``module_path``. Cached per module,
+    since it walks the package's ``__path__`` on disk and doesn't change for an imported module."""
+    root_path = os.path.dirname(module_path)
+    module_name = inspect.getmodulename(module_path)
+
+    # Adapted from https://github.com/modal-labs/modal-client/blob/main/modal/_function_utils.py#L94
+    if getattr(py_module, "__package__", None):
+        module_path = os.path.abspath(py_module.__file__)
+        package_paths = [
+            os.path.abspath(p) for p in __import__(py_module.__package__).__path__
+        ]
+        # Both sides are already absolute and normalized, so a prefix check is equivalent to commonpath
+        base_dirs = [
+            base_dir
+            for base_dir in package_paths
+            if module_path == base_dir
+            or module_path.startswith(base_dir.rstrip(os.sep) + os.sep)
+        ]
+
+        if len(base_dirs) != 1:
+            logger.debug(f"Module files: {module_path}")
+            logger.debug(f"Package paths: {package_paths}")
+            logger.debug(f"Base dirs: {base_dirs}")
+            raise Exception("Wasn't able to find the package directory!")
+        root_path = os.path.dirname(base_dirs[0])
+        module_name = py_module.__spec__.name
+
+    return root_path, module_name
 
 
 def get_module_import_info(raw_cls_or_fn: Union[Type, Callable]):
@@ -335,8 +450,7 @@ def get_module_import_info(raw_cls_or_fn: Union[Type, Callable]):
     # Background on all these dunders: https://docs.python.org/3/reference/import.html
     py_module = inspect.getmodule(raw_cls_or_fn)
 
-    # Need to resolve in case just filename is given
-    module_path = extract_module_path(raw_cls_or_fn)
+    module_path = _module_path(py_module)
 
     # TODO better way of detecting if in a notebook or interactive Python env
     if not module_path or module_path.endswith("ipynb"):
@@ -349,31 +463,10 @@ def get_module_import_info(raw_cls_or_fn: Union[Type, Callable]):
         module_name = "notebook"
         cls_or_fn_name = raw_cls_or_fn.__name__
     else:
-        root_path = os.path.dirname(module_path)
-        module_name = inspect.getmodulename(module_path)
+        root_path, module_name = _module_root_and_name(py_module, module_path)
         # TODO __qualname__ doesn't work when fn is aliased funnily, like torch.sum
         cls_or_fn_name = getattr(raw_cls_or_fn, "__qualname__", raw_cls_or_fn.__name__)
 
-        # Adapted from https://github.com/modal-labs/modal-client/blob/main/modal/_function_utils.py#L94
-        if getattr(py_module, "__package__", None):
-            module_path = os.path.abspath(py_module.__file__)
-            package_paths = [
-                os.path.abspath(p) for p in __import__(py_module.__package__).__path__
-            ]
-            base_dirs = [
-                base_dir
-                for base_dir in package_paths
-                if os.path.commonpath((base_dir, module_path)) == base_dir
-            ]
-
-            if len(base_dirs) != 1:
-                logger.debug(f"Module files: {module_path}")
-                logger.debug(f"Package paths: {package_paths}")
-                logger.debug(f"Base dirs: {base_dirs}")
-                raise Exception("Wasn't able to find the package directory!")
-            root_path = os.path.dirname(base_dirs[0])
-            module_name = py_module.__spec__.name
-
     return root_path, module_name, cls_or_fn_name
 
 
@@ -391,8 +484,7 @@ def run_command_with_password_login(
         command_run.logfile_read = sys.stdout
 
     # If CommandRunner uses the control path, the password may not be requested
-    password_prompt_pattern = re.compile(r"[Pp]assword:")
-    next_line = command_run.expect([password_prompt_pattern, pexpect.EOF])
+    next_line = command_run.expect([_PASSWORD_PROMPT_RE, pexpect.EOF])
     if next_line == 0:
         command_run.sendline(password)
         command_run.expect(pexpect.EOF)
@@ -423,43 +515,101 @@ def thread_coroutine(coroutine, context=None):
         loop.close()
 
 
-# We should minimize calls to this since each one will start a new thread.
+# Shared worker threads for the sync <-> async bridges below, so that each call doesn't spin up (and tear down)
+# a fresh thread. A worker is only handed out when one is free: if every worker is busy (e.g. held by long-running
+# user methods, or by nested bridge calls), we fall back to a dedicated thread rather than queueing, since a queued
+# call could be waiting on one of the very calls that's holding a worker.
+_SYNC_POOL_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_sync_pool = None
+_sync_pool_busy = 0
+_sync_pool_lock = threading.Lock()
+
+
+def _acquire_sync_pool() -> Optional[ThreadPoolExecutor]:
+    global _sync_pool, _sync_pool_busy
+    with _sync_pool_lock:
+        if _sync_pool_busy >= _SYNC_POOL_MAX_WORKERS:
+            return None
+        if _sync_pool is None:
+            _sync_pool = ThreadPoolExecutor(
+                max_workers=_SYNC_POOL_MAX_WORKERS, thread_name_prefix="rh-sync"
+            )
+        _sync_pool_busy += 1
+        return _sync_pool
+
+
+def _release_sync_pool(*args):
+    global _sync_pool_busy
+    with _sync_pool_lock:
+        _sync_pool_busy -= 1
+
+
+_sync_pool_local = threading.local()
+
+
+def _run_on_worker_loop(coroutine):
+    # Each pooled worker keeps its event loop across calls instead of creating and closing one every time.
+    # Every worker still runs one coroutine at a time on its own loop, as with a fresh thread per call.
+    loop = getattr(_sync_pool_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        _sync_pool_local.loop = loop
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        # Don't let tasks left behind by this call run on during the next one
+        leftover_tasks = asyncio.all_tasks(loop)
+        if leftover_tasks:
+            for task in leftover_tasks:
+                task.cancel()
+            loop.run_until_complete(
+                asyncio.gather(*leftover_tasks, return_exceptions=True)
+            )
+
+
 # Technically we should not have many threads running async logic at once, however, the calling thread
 # will actually block until the async logic that is spawned in the other thread is done.
 def sync_function(coroutine_func):
     @functools.wraps(coroutine_func)
     def wrapper(*args, **kwargs):
-        # Better API than using threading.Thread, since we just need the thread temporarily
-        # and the resources are cleaned up
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(
-                thread_coroutine,
-                coroutine_func(*args, **kwargs),
-                contextvars.copy_context(),
-            )
-            return future.result()
+        # Run in a copy of the caller's context, rather than setting the vars on the thread, so nothing
+        # leaks into the next call that lands on the same pooled thread
+        context = contextvars.copy_context()
+        coroutine = coroutine_func(*args, **kwargs)
+        pool = _acquire_sync_pool()
+        if pool is None:
+            # Better API than using threading.Thread, since we just need the thread temporarily
+            # and the resources are cleaned up
+            with ThreadPoolExecutor() as executor:
+                return executor.submit(
+                    context.run, thread_coroutine, coroutine
+                ).result()
+
+        future = pool.submit(context.run, _run_on_worker_loop, coroutine)
+        future.add_done_callback(_release_sync_pool)
+        return future.result()
 
     return wrapper
 
 
 async def arun_in_thread(method_to_run, *args, **kwargs):
-    def _run_sync_fn_with_context(context_to_set, sync_fn, method_args, method_kwargs):
-        for var, value in context_to_set.items():
-            var.set(value)
+    run_with_context = functools.partial(
+        contextvars.copy_context().run, method_to_run, *args, **kwargs
+    )
 
-        return sync_fn(*method_args, **method_kwargs)
-
-    with ThreadPoolExecutor() as executor:
-        return await asyncio.get_event_loop().run_in_executor(
-            executor,
-            functools.partial(
-                _run_sync_fn_with_context,
-                context_to_set=contextvars.copy_context(),
-                sync_fn=method_to_run,
-                method_args=args,
-                method_kwargs=kwargs,
-            ),
-        )
+    pool = _acquire_sync_pool()
+    if pool is None:
+        with ThreadPoolExecutor() as executor:
+            return await asyncio.get_event_loop().run_in_executor(
+                executor, run_with_context
+            )
+
+    # Release on the thread's completion rather than ours, in case this coroutine is cancelled first
+    future = pool.submit(run_with_context)
+    future.add_done_callback(_release_sync_pool)
+    return await asyncio.wrap_future(future)
 
 
 ####################################################################################################
@@ -473,6 +623,9 @@ def get_pid():
     return os.getpid()
 
 
+# Resolving the hostname can block on DNS / NSS, and a node's IP doesn't change while the process is up.
+# Use get_node_ip.cache_clear() to force a fresh lookup.
+@functools.lru_cache(maxsize=1)
 def get_node_ip():
     import socket
 
@@ -493,10 +646,16 @@ class ThreadWithException(threading.Thread):
             raise self._exc
 
 
-def client_call_wrapper(client, system, client_method_name, *args, **kwargs):
+@functools.lru_cache(maxsize=1)
+def _cluster_cls():
+    # Imported lazily since runhouse.resources imports this module
     from runhouse.resources.hardware import Cluster
 
-    if system and isinstance(system, Cluster) and not system.on_this_cluster():
+    return Cluster
+
+
+def client_call_wrapper(client, system, client_method_name, *args, **kwargs):
+    if system and isinstance(system, _cluster_cls()) and not system.on_this_cluster():
         return system.call_client_method(client_method_name, *args, **kwargs)
     method = getattr(client, client_method_name)
     return method(*args, **kwargs)
@@ -506,27 +665,42 @@ def client_call_wrapper(client, system, client_method_name, *args, **kwargs):
 # Logging redirection
 ####################################################################################################
 class StreamTee(object):
+    # Flush outstreams at least this often (in characters) even if no line has been completed
+    FLUSH_THRESHOLD = 4096
+
     def __init__(self, instream, outstreams):
         self.instream = instream
         self.outstreams = outstreams
+        self._pending = 0
 
     def write(self, message):
         self.instream.write(message)
+        if not message:
+            return
+
         for stream in self.outstreams:
-            if message:
-                stream.write(message)
-                # We flush here to ensure that the logs are written to the file immediately
-                # see https://github.com/run-house/runhouse/pull/724
-                stream.flush()
+            stream.write(message)
+
+        # We flush to ensure that the logs are written to the file promptly, see
+        # https://github.com/run-house/runhouse/pull/724. We only need to do so once a line is complete (or a
+        # carriage return redraws one, e.g. progress bars), rather than on every partial write such as
+        # print's separate write of the trailing newline.
+        self._pending += len(message)
+        if "\n" in message or "\r" in message or self._pending >= self.FLUSH_THRESHOLD:
+            self._flush_outstreams()
 
     def writelines(self, lines):
         self.instream.writelines(lines)
         for stream in self.outstreams:
             stream.writelines(lines)
-            stream.flush()
+        self._flush_outstreams()
 
     def flush(self):
         self.instream.flush()
+        self._flush_outstreams()
+
+    def _flush_outstreams(self):
+        self._pending = 0
         for stream in self.outstreams:
             stream.flush()
 
@@ -591,15 +765,24 @@ class LogToFolder:
         os.makedirs(self.directory, exist_ok=True)
         self.logger = None
         self.handler = None
+        self._stdout_file = None
+        self._stderr_file = None
+        self._stdout_tee = None
+        self._stderr_tee = None
 
     def __enter__(self):
         # TODO fix the fact that we keep appending and then stream back the full file
-        sys.stdout = StreamTee(sys.stdout, [Path(self._stdout_path).open(mode="a")])
-        sys.stderr = StreamTee(sys.stderr, [Path(self._stderr_path).open(mode="a")])
+        self._stdout_file = open(self._stdout_path, mode="a")
+        self._stderr_file = open(self._stderr_path, mode="a")
+        self._stdout_tee = StreamTee(sys.stdout, [self._stdout_file])
+        self._stderr_tee = StreamTee(sys.stderr, [self._stderr_file])
+        sys.stdout = self._stdout_tee
+        sys.stderr = self._stderr_tee
 
         self.logger = logging.getLogger()
         init_logger(self.logger)
-        self.handler = logging.FileHandler(self._stdout_path)
+        # Log records go through the same open stdout file rather than a second handle on the same path
+        self.handler = logging.StreamHandler(self._stdout_file)
         self.logger.addHandler(self.handler)
 
         return self
@@ -610,26 +793,45 @@ class LogToFolder:
         sys.stdout.flush()
         sys.stderr.flush()
 
-        # Restore stdout and stderr
-        if hasattr(sys.stdout, "instream"):
-            sys.stdout = sys.stdout.instream
-        if hasattr(sys.stderr, "instream"):
-            sys.stderr = sys.stderr.instream
+        # Restore stdout and stderr. Contexts for concurrent calls in the same servlet don't necessarily exit in the
+        # order they entered, so take this context's tees out of the chain rather than restoring the streams they
+        # wrapped, which could leave another context's (closed) file on sys.stdout.
+        sys.stdout = self._remove_tee(sys.stdout, self._stdout_tee)
+        sys.stderr = self._remove_tee(sys.stderr, self._stderr_tee)
 
-        # Close the file handler
+        # Close the log handler and the log files
         self.handler.close()
         self.logger.removeHandler(self.handler)
         init_logger(self.logger)
+        self._stdout_file.close()
+        self._stderr_file.close()
 
         # return False to propagate any exception that occurred inside the with block
         return False
 
-    @property
+    @staticmethod
+    def _remove_tee(stream, tee: StreamTee):
+        """Unlink ``tee`` from the chain of tees ending at ``stream``, and return the new head of the chain."""
+        # Anything still holding on to the tee (e.g. a logging handler created while it was sys.stdout) now writes
+        # straight through to the stream it wrapped, and no longer to the file that's about to be closed
+        tee.outstreams = []
+        if stream is tee:
+            return tee.instream
+
+        current = stream
+        while isinstance(current, StreamTee):
+            if current.instream is tee:
+                current.instream = tee.instream
+                break
+            current = current.instream
+        return stream
+
+    @functools.cached_property
     def _stdout_path(self) -> str:
         """Path to the stdout file for the Run."""
         return self._path_to_file_by_ext(ext=".out")
 
-    @property
+    @functools.cached_property
     def _stderr_path(self) -> str:
         """Path to the stderr file for the Run."""
         return self._path_to_file_by_ext(ext=".err")
@@ -684,7 +886,7 @@ class SuppressStd(object):
         # Redirect the stdout/stderr fd to temp file
         self.orig_stdout_dup = os.dup(self.orig_stdout_fileno)
         self.orig_stderr_dup = os.dup(self.orig_stderr_fileno)
-        self.tfile = tempfile.TemporaryFile(mode="w+b")
+        self.tfile = self._capture_file()
         os.dup2(self.tfile.fileno(), self.orig_stdout_fileno)
         os.dup2(self.tfile.fileno(), self.orig_stderr_fileno)
 
@@ -696,6 +898,15 @@ class SuppressStd(object):
 
         return self
 
+    @staticmethod
+    def _capture_file():
+        # Where available, capture into an anonymous in-memory file rather than a temp file on disk. It's still
+        # a real fd, so output from child processes (which may outlive the block, e.g. ssh control masters) is
+        # captured the same way, and reading it back never waits on them.
+        if hasattr(os, "memfd_create"):
+            return open(os.memfd_create("rh-suppress-std"), "w+b")
+        return tempfile.TemporaryFile(mode="w+b")
+
     def __exit__(self, exc_class, value, traceback):
         # Make sure to flush stdout
         print(flush=True)
@@ -728,15 +939,21 @@ class SuppressStd(object):
 ####################################################################################################
 
 
-def generate_default_name(prefix: str = None, precision: str = "s", sep="_") -> str:
-    """Name of the Run's parent folder which contains the Run's data (config, stdout, stderr, etc).
-    If a name is provided, prepend that to the current timestamp to complete the folder name."""
+@functools.lru_cache(maxsize=16)
+def _timestamp_format(precision: str, sep: str) -> str:
     if precision == "d":
-        timestamp_key = f"{datetime.now().strftime('%Y%m%d')}"
+        return "%Y%m%d"
     elif precision == "s":
-        timestamp_key = f"{datetime.now().strftime(f'%Y%m%d{sep}%H%M%S')}"
+        return f"%Y%m%d{sep}%H%M%S"
     elif precision == "ms":
-        timestamp_key = f"{datetime.now().strftime(f'%Y%m%d{sep}%H%M%S_%f')}"
+        return f"%Y%m%d{sep}%H%M%S_%f"
+    raise ValueError(f"Invalid precision {precision}, must be one of 'd', 's', 'ms'")
+
+
+def generate_default_name(prefix: str = None, precision: str = "s", sep="_") -> str:
+    """Name of the Run's parent folder which contains the Run's data (config, stdout, stderr, etc).
+    If a name is provided, prepend that to the current timestamp to complete the folder name."""
+    timestamp_key = datetime.now().strftime(_timestamp_format(precision, sep))
     if prefix is None:
         return timestamp_key
     return f"{prefix}{sep}{timestamp_key}"
@@ -767,60 +984,53 @@ class ColoredFormatter:
     # TODO: This method is a temp solution, until we'll update logging architecture. Remove once logging is cleaned up.
     @classmethod
     def format_log(cls, text):
-        ansi_escape = re.compile(r"(?:\x1B[@-_][0-?]*[ -/]*[@-~])")
-        return ansi_escape.sub("", text)
+        # Most lines carry no escape codes at all, so skip the regex for those
+        if "\x1b" not in text:
+            return text
+        return _ANSI_ESCAPE_RE.sub("", text)
 
 
 class ClusterLogsFormatter:
+    SYSTEM_COLOR = ColoredFormatter.get_color("cyan")
+    RESET_COLOR = ColoredFormatter.get_color("reset")
+
     def __init__(self, system):
         self.system = system
         self._display_title = False
 
+    def _print_title(self, system_name: str):
+        # Display the system name before subsequent logs only once
+        dotted_line = "-" * len(system_name)
+        print(dotted_line)
+        print(f"{self.SYSTEM_COLOR}{system_name}{self.RESET_COLOR}")
+        print(dotted_line)
+
+        self._display_title = True
+
     def format_server_log(self, output_type):
+        # Once the title is out, there's nothing left to do per log line
+        if self._display_title:
+            return self.SYSTEM_COLOR, self.RESET_COLOR
+
         from runhouse import Resource
         from runhouse.servers.http.http_utils import OutputType
 
-        system_color = ColoredFormatter.get_color("cyan")
-        reset_color = ColoredFormatter.get_color("reset")
-
         prettify_logs = output_type in [
             OutputType.STDOUT,
             OutputType.EXCEPTION,
             OutputType.STDERR,
         ]
 
-        if (
-            isinstance(self.system, Resource)
-            and prettify_logs
-            and not self._display_title
-        ):
-            # Display the system name before subsequent logs only once
-            system_name = self.system.name
-            dotted_line = "-" * len(system_name)
-            print(dotted_line)
-            print(f"{system_color}{system_name}{reset_color}")
-            print(dotted_line)
+        if isinstance(self.system, Resource) and prettify_logs:
+            self._print_title(self.system.name)
 
-            # Only display the system name once
-            self._display_title = True
-
-        return system_color, reset_color
+        return self.SYSTEM_COLOR, self.RESET_COLOR
 
     def format_launcher_log(self):
-        system_color = ColoredFormatter.get_color("cyan")
-        reset_color = ColoredFormatter.get_color("reset")
-
         if not self._display_title:
-            # Display the system name before subsequent logs only once
-            dotted_line = "-" * len(self.system)
-            print(dotted_line)
-            print(f"{system_color}{self.system}{reset_color}")
-            print(dotted_line)
-
-            # Only display the system name once
-            self._display_title = True
+            self._print_title(self.system)
 
-        return system_color, reset_color
+        return self.SYSTEM_COLOR, self.RESET_COLOR
 
 
 def create_local_dir(path: Union[str, Path]):
@@ -854,16 +1064,18 @@ class Spinner:
         if self._thread and self._thread.is_alive():
             self.stop()
         self.done = False
+        self._frames = [f"\r{self.desc} {c}" for c in self.steps]
         self._thread = threading.Thread(target=self._animate, daemon=True)
         self._thread.start()
         return self
 
     def _animate(self):
         """Animates the loader by cycling through steps."""
-        for c in cycle(self.steps):
+        for frame in cycle(self._frames):
             if self.done:
                 break
-            print(f"\r{self.desc} {c}", flush=True, end="")
+            sys.stdout.write(frame)
+            sys.stdout.flush()
             sleep(self.timeout)
 
     def __enter__(self):
@@ -895,62 +1107,63 @@ class ServletType(str, Enum):
     cluster = "cluster"
 
 
+_get_used_memory = itemgetter("used_memory")
+
+
 def parse_gpu_usage(collected_gpu_info: dict, servlet_type: ServletType):
 
     if not collected_gpu_info:
         return
 
-    gpus_indices = list(collected_gpu_info.keys())
+    collected_gpus_samples = [
+        gpu_samples for gpu_samples in collected_gpu_info.values() if gpu_samples
+    ]
+    if not collected_gpus_samples:
+        # gpus were found, but no usage was collected for any of them yet
+        return
+
+    is_cluster = servlet_type == ServletType.cluster
+    first_gpu_samples = collected_gpus_samples[0]
 
     # how we retrieve total_gpu_memory:
-    # 1. getting the first gpu usage of the first gpu in the gpus list
+    # 1. getting the first gpu usage of the first gpu (that has collected usage) in the gpus list
     # 2. getting the first gpu_info dictionary of the specific gpu (we collected the gpu info over time)
     # 3. get total_memory value (it is the same across all envs)
-    total_gpu_memory = collected_gpu_info[gpus_indices[0]][0].get("total_memory")
-    total_used_memory, gpu_utilization_percent, free_memory = 0, 0, 0
-
-    if servlet_type == ServletType.cluster:
-        free_memory = collected_gpu_info[gpus_indices[0]][-1].get(
-            "free_memory"
-        )  # getting the latest free_memory value collected.
-
-    for gpu_index in gpus_indices:
-        current_collected_gpu_info = collected_gpu_info.get(gpu_index)
-        if not current_collected_gpu_info:
-            continue
-        sum_used_memery = sum(
-            [gpu_info.get("used_memory") for gpu_info in current_collected_gpu_info]
-        )
-        total_used_memory = sum_used_memery / len(collected_gpu_info)  # average
-
-        if servlet_type == ServletType.cluster:
-            sum_cpu_util = sum(
-                [
-                    gpu_info.get("utilization_percent")
-                    for gpu_info in current_collected_gpu_info
-                ]
-            )
-            gpu_utilization_percent = sum_cpu_util / len(
-                current_collected_gpu_info
-            )  # average
+    total_gpu_memory = first_gpu_samples[0].get("total_memory")
+
+    # Sum over every sample of every gpu, and divide once by the number of samples, so we get the average per gpu
+    # (total_memory is also per gpu) over the collection period.
+    sum_used_memory, sum_gpu_util, samples_count = 0, 0, 0
+    for current_collected_gpu_info in collected_gpus_samples:
+        samples_count += len(current_collected_gpu_info)
+        # Process servlets only collect memory usage, so only the cluster's samples carry utilization
+        if is_cluster:
+            for gpu_info in current_collected_gpu_info:
+                sum_used_memory += gpu_info["used_memory"]
+                sum_gpu_util += gpu_info["utilization_percent"]
+        else:
+            sum_used_memory += sum(map(_get_used_memory, current_collected_gpu_info))
 
-    total_used_memory = int(total_used_memory / len(gpus_indices))
+    total_used_memory = int(sum_used_memory / samples_count)  # average
     used_memory_percent = round(
         (total_used_memory / total_gpu_memory) * 100, 2
     )  # values can be between 0 and 100
 
-    gpu_usage = {
+    if is_cluster:
+        return {
+            "total_memory": total_gpu_memory,
+            "used_memory": total_used_memory,
+            "used_memory_percent": used_memory_percent,
+            # getting the latest free_memory value collected.
+            "free_memory": first_gpu_samples[-1].get("free_memory"),
+            "gpu_count": len(collected_gpu_info),
+            "utilization_percent": round(
+                sum_gpu_util / samples_count, 2
+            ),  # average, value can be from 0 to 100
+        }
+
+    return {
         "total_memory": total_gpu_memory,
         "used_memory": total_used_memory,
         "used_memory_percent": used_memory_percent,
     }
-
-    if servlet_type == ServletType.cluster:
-        gpu_utilization_percent = round(gpu_utilization_percent / len(gpus_indices), 2)
-        gpu_usage["free_memory"] = free_memory
-        gpu_usage["gpu_count"] = len(gpus_indices)
-        gpu_usage[
-            "utilization_percent"
-        ] = gpu_utilization_percent  # value can be from 0 to 100
-
-    return gpu_usage
@@ -1,20 +1,27 @@
 import copy
 import json
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, patch
 
 import pytest
+import requests
 import runhouse as rh
 from runhouse.constants import DEFAULT_PROCESS_NAME, DEFAULT_SERVER_PORT
 
 from runhouse.globals import rns_client
 
 from runhouse.servers.http import HTTPClient
+
 from runhouse.servers.http.http_utils import (
     DeleteObjectParams,
     PutObjectParams,
+    PutObjectsParams,
     serialize_data,
 )
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
 
 
 @pytest.mark.servertest
@@ -43,7 +50,7 @@ class TestHTTPClient:
         mock_response = mocker.Mock()
         mock_response.status_code = 200
         rh_version_resp = {"rh_version": rh.__version__}
-        mock_response.json.return_value = rh_version_resp
+        mock_response.content = json.dumps(rh_version_resp).encode()
         mocked_get = mocker.patch("requests.Session.get", return_value=mock_response)
 
         self.client.check_server()
@@ -55,6 +62,57 @@ class TestHTTPClient:
             verify=expected_verify,
         )
 
+    @pytest.mark.level("unit")
+    def test_check_server_does_not_retry_connect_timeouts(self, mocker):
+        def timed_out_connect(conn):
+            raise ConnectTimeoutError(conn, "Connection timed out")
+
+        mocked_connect = mocker.patch.object(
+            HTTPConnection, "connect", autospec=True, side_effect=timed_out_connect
+        )
+
+        with pytest.raises(requests.exceptions.ConnectTimeout):
+            self.client.check_server()
+
+        assert mocked_connect.call_count == 1
+
+    @pytest.mark.level("unit")
+    def test_refused_connects_are_retried(self, mocker):
+        def refused_connect(conn):
+            raise NewConnectionError(
+                conn, "Connection refused"
+            ) from ConnectionRefusedError(111, "Connection refused")
+
+        mocked_connect = mocker.patch.object(
+            HTTPConnection, "connect", autospec=True, side_effect=refused_connect
+        )
+        mocker.patch("time.sleep")
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            self.client.check_server()
+
+        # The first attempt plus the adapter's 3 connect retries
+        assert mocked_connect.call_count == 4
+
+    @pytest.mark.level("unit")
+    def test_call_logs_do_not_queue_behind_other_calls(self, mocker):
+        from runhouse.servers.http import http_client
+
+        shared_executor = ThreadPoolExecutor(max_workers=1)
+        mocker.patch.object(http_client, "_CALL_LOGS_MAX_WORKERS", 1)
+        mocker.patch.object(http_client, "_call_logs_executor", shared_executor)
+
+        # The first log stream holds the only shared worker until its call is done
+        first_call_done = threading.Event()
+        first_logs_future = http_client._submit_call_logs(first_call_done.wait)
+
+        second_logs_future = http_client._submit_call_logs(lambda: "streamed")
+        assert second_logs_future.result(timeout=5) == "streamed"
+
+        first_call_done.set()
+        first_logs_future.result(timeout=5)
+        shared_executor.shutdown()
+
     @pytest.mark.level("unit")
     def test_get_certificate(self, mocker):
 
@@ -150,11 +208,13 @@ class TestHTTPClient:
         # Mock the response to iter_lines to return our simulated server response
         mock_response = mocker.Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "output_type": "result_serialized",
-            "data": serialize_data("final_result", "pickle"),
-            "serialization": "pickle",
-        }
+        mock_response.content = json.dumps(
+            {
+                "output_type": "result_serialized",
+                "data": serialize_data("final_result", "pickle"),
+                "serialization": "pickle",
+            }
+        ).encode()
         mock_post = mocker.patch("requests.Session.post", return_value=mock_response)
 
         # Mock response to the logs function separately
@@ -213,11 +273,13 @@ class TestHTTPClient:
         # Mock the response to iter_lines to return our simulated server response
         mock_response = mocker.Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "output_type": "success",
-            "data": None,
-            "serialization": None,
-        }
+        mock_response.content = json.dumps(
+            {
+                "output_type": "success",
+                "data": None,
+                "serialization": None,
+            }
+        ).encode()
         mock_post = mocker.patch("requests.Session.post", return_value=mock_response)
 
         # Mock response to the logs function separately
@@ -286,10 +348,12 @@ class TestHTTPClient:
         test_data = self.local_cluster.config()
         mock_response = mocker.Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "output_type": "config",
-            "data": copy.copy(test_data),
-        }
+        mock_response.content = json.dumps(
+            {
+                "output_type": "config",
+                "data": copy.copy(test_data),
+            }
+        ).encode()
         _ = mocker.patch("requests.Session.post", return_value=mock_response)
 
         cluster = self.client.call(
@@ -323,6 +387,32 @@ class TestHTTPClient:
         assert actual_data.serialized_data == expected_data
         assert actual_data.serialization == "pickle"
 
+    @pytest.mark.level("unit")
+    def test_put_objects(self, mocker):
+
+        mock_request = mocker.patch("runhouse.servers.http.HTTPClient.request_json")
+
+        objects = {"my_list": list(range(5)), "my_str": "a string"}
+
+        self.client.put_objects(objects)
+
+        mock_request.assert_called_once_with(
+            "objects",
+            req_type="post",
+            json_dict=mocker.ANY,
+            err_str=mocker.ANY,
+        )
+        assert (
+            mock_request.call_args[1]["err_str"]()
+            == f"Error putting objects {list(objects)}"
+        )
+
+        actual_data = PutObjectsParams(**mock_request.call_args[1]["json_dict"])
+        assert actual_data.serialized_data == {
+            key: serialize_data(value, "pickle") for key, value in objects.items()
+        }
+        assert actual_data.serialization == "pickle"
+
     @pytest.mark.level("unit")
     def test_get_keys(self, mocker):
         mock_request = mocker.patch("runhouse.servers.http.HTTPClient.request")
@@ -351,8 +441,9 @@ class TestHTTPClient:
             "delete_object",
             req_type="post",
             json_dict=mocker.ANY,
-            err_str=f"Error deleting keys {keys}",
+            err_str=mocker.ANY,
         )
+        assert mock_request.call_args[1]["err_str"]() == f"Error deleting keys {keys}"
 
         actual_data = DeleteObjectParams(**mock_request.call_args[1]["json_dict"])
         assert actual_data.keys == keys
@@ -11,6 +11,7 @@ from runhouse.servers.http.http_utils import (
     DeleteObjectParams,
     deserialize_data,
     PutObjectParams,
+    PutObjectsParams,
     PutResourceParams,
     RenameObjectParams,
     serialize_data,
@@ -771,6 +772,29 @@ class TestHTTPServerNoDocker:
         )
         assert response.status_code == 200
 
+    @pytest.mark.level("unit")
+    def test_put_objects(self, client, local_cluster):
+        objects = {"key3": list(range(5)), "key4": "a string"}
+        response = client.post(
+            "/objects",
+            json=PutObjectsParams(
+                serialized_data={
+                    key: serialize_data(value, "pickle")
+                    for key, value in objects.items()
+                },
+                serialization="pickle",
+            ).model_dump(),
+            headers=rns_client.request_headers(local_cluster.rns_address),
+        )
+        assert response.status_code == 200
+
+        response = client.get(
+            "/keys",
+            headers=rns_client.request_headers(local_cluster.rns_address),
+        )
+        keys = response.json().get("data")
+        assert all(key in keys for key in objects)
+
     @pytest.mark.level("unit")
     def test_rename_object(self, client, local_cluster):
         old_key = "key1"
@@ -1,6 +1,7 @@
 import pytest
 
 from runhouse.globals import rns_client
+from runhouse.servers.http.auth import AuthCache
 from runhouse.servers.obj_store import ObjStoreError
 
 from tests.utils import friend_account, get_ray_servlet_and_obj_store
@@ -346,3 +347,92 @@ class TestAuthCacheObjStore:
             resource_uri = f"/{test_account_dict['username']}/summer"
             access_level = obj_store.resource_access_level(cluster_token, resource_uri)
             assert access_level is None
+
+
+class TestAuthCache:
+    """Access levels are loaded from a mocked Den, on a mocked clock"""
+
+    TOKEN = "test-token"
+    RESOURCE_URI = "/test-user/summer"
+
+    @pytest.fixture(autouse=True)
+    def init_fixtures(self, mocker):
+        self.auth_cache = AuthCache()
+        self.now = 1000.0
+        self.access_levels = {}
+
+        def den_get(uri, headers):
+            token = headers["Authorization"].split(" ")[-1]
+            access_level = self.access_levels.get(token)
+            resp = mocker.Mock()
+            # Den doesn't return an access level for a resource the user can no longer access
+            resp.status_code = 200 if access_level else 403
+            resp.json.return_value = {"data": {"access_level": access_level}}
+            resp.content = b'{"detail": "Unauthorized"}'
+            return resp
+
+        mocker.patch(
+            "runhouse.servers.http.auth.username_from_token", return_value="test-user"
+        )
+        self.mocked_get = mocker.patch.object(
+            rns_client, "session", get=mocker.Mock(side_effect=den_get)
+        ).get
+        mocked_time = mocker.patch("runhouse.servers.http.auth.time")
+        mocked_time.monotonic.side_effect = lambda: self.now
+
+    @pytest.mark.level("unit")
+    def test_access_level_expires_after_ttl(self):
+        self.access_levels[self.TOKEN] = "write"
+
+        assert (
+            self.auth_cache.lookup_access_level(self.TOKEN, self.RESOURCE_URI)
+            == "write"
+        )
+        self.now += AuthCache.ACCESS_LEVEL_TTL_SEC - 1
+        assert (
+            self.auth_cache.lookup_access_level(self.TOKEN, self.RESOURCE_URI)
+            == "write"
+        )
+        assert self.mocked_get.call_count == 1
+
+        self.now += 1
+        assert (
+            self.auth_cache.lookup_access_level(self.TOKEN, self.RESOURCE_URI)
+            == "write"
+        )
+        assert self.mocked_get.call_count == 2
+
+    @pytest.mark.level("unit")
+    def test_clear_cache_for_token(self):
+        other_token = "other-token"
+        self.access_levels[self.TOKEN] = "write"
+        self.access_levels[other_token] = "read"
+        self.auth_cache.lookup_access_level(self.TOKEN, self.RESOURCE_URI)
+        self.auth_cache.lookup_access_level(other_token, self.RESOURCE_URI)
+        assert self.mocked_get.call_count == 2
+
+        self.auth_cache.clear_cache(self.TOKEN)
+        assert (self.TOKEN, self.RESOURCE_URI) not in self.auth_cache.CACHE
+        assert self.TOKEN not in self.auth_cache.USERNAMES
+
+        # Only the cleared token's access level is loaded again
+        self.auth_cache.lookup_access_level(self.TOKEN, self.RESOURCE_URI)
+        self.auth_cache.lookup_access_level(other_token, self.RESOURCE_URI)
+        assert self.mocked_get.call_count == 3
+
+    @pytest.mark.level("unit")
+    def test_revoked_access_does_not_outlive_ttl(self):
+        self.access_levels[self.TOKEN] = "read"
+        assert (
+            self.auth_cache.lookup_access_level(self.TOKEN, self.RESOURCE_URI) == "read"
+        )
+
+        del self.access_levels[self.TOKEN]
+        self.now += AuthCache.ACCESS_LEVEL_TTL_SEC
+        assert (
+            self.auth_cache.lookup_access_level(self.TOKEN, self.RESOURCE_URI) is None
+        )
+        assert (
+            self.auth_cache.lookup_access_level(self.TOKEN, self.RESOURCE_URI) is None
+        )
+        assert self.mocked_get.call_count == 3
@@ -1,4 +1,5 @@
 import logging
+import sys
 import time
 
 import pytest
@@ -6,6 +7,7 @@ import pytest
 from runhouse.resources.resource import Resource
 from runhouse.servers.http.http_utils import deserialize_data, serialize_data
 from runhouse.servers.obj_store import ObjStore
+from runhouse.utils import LogToFolder, parse_gpu_usage, ServletType
 
 from tests.utils import init_remote_cluster_servlet_actor
 
@@ -118,3 +120,91 @@ class TestServlet:
             str(error.value)
             == "Failed to look up actor with name 'invalid_cluster_servlet'. This could because 1. You are trying to look up a named actor you didn't create. 2. The named actor died. 3. You did not use a namespace matching the namespace of the actor."
         )
+
+
+def _gpu_sample(used_memory, utilization_percent, free_memory=None):
+    return {
+        "total_memory": 1000,
+        "used_memory": used_memory,
+        "free_memory": free_memory,
+        "utilization_percent": utilization_percent,
+    }
+
+
+class TestParseGPUUsage:
+    @pytest.mark.level("unit")
+    def test_parse_gpu_usage_multiple_gpus(self):
+        collected_gpu_info = {
+            0: [_gpu_sample(100, 10), _gpu_sample(300, 30, free_memory=5)],
+            1: [_gpu_sample(500, 50), _gpu_sample(700, 70, free_memory=9)],
+        }
+
+        gpu_usage = parse_gpu_usage(collected_gpu_info, ServletType.cluster)
+
+        assert gpu_usage == {
+            "total_memory": 1000,
+            "used_memory": 400,
+            "used_memory_percent": 40.0,
+            "free_memory": 5,
+            "gpu_count": 2,
+            "utilization_percent": 40.0,
+        }
+
+    @pytest.mark.level("unit")
+    def test_parse_gpu_usage_gpu_without_samples(self):
+        gpu_usage = parse_gpu_usage(
+            {0: [_gpu_sample(100, 10)], 1: []}, ServletType.cluster
+        )
+        assert gpu_usage["used_memory"] == 100
+        assert gpu_usage["utilization_percent"] == 10.0
+        # gpus without samples yet are still counted
+        assert gpu_usage["gpu_count"] == 2
+
+        gpu_usage = parse_gpu_usage(
+            {0: [], 1: [_gpu_sample(200, 20, free_memory=3)]}, ServletType.cluster
+        )
+        assert gpu_usage["used_memory"] == 200
+        assert gpu_usage["free_memory"] == 3
+        assert gpu_usage["gpu_count"] == 2
+
+        assert parse_gpu_usage({0: [], 1: []}, ServletType.cluster) is None
+        assert parse_gpu_usage({}, ServletType.cluster) is None
+
+    @pytest.mark.level("unit")
+    def test_parse_gpu_usage_process(self):
+        collected_gpu_info = {
+            0: [_gpu_sample(100, 10), _gpu_sample(300, 30)],
+            1: [_gpu_sample(500, 50), _gpu_sample(700, 70)],
+        }
+
+        gpu_usage = parse_gpu_usage(collected_gpu_info, ServletType.process)
+
+        assert gpu_usage == {
+            "total_memory": 1000,
+            "used_memory": 400,
+            "used_memory_percent": 40.0,
+        }
+
+
+class TestLogToFolder:
+    @pytest.mark.level("unit")
+    def test_interleaved_log_contexts(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("runhouse.utils.RH_LOGFILE_PATH", tmp_path)
+        stdout, stderr = sys.stdout, sys.stderr
+
+        # Concurrent calls in the same servlet can exit their log contexts out of order
+        first_ctx, second_ctx = LogToFolder(name="first"), LogToFolder(name="second")
+        first_ctx.__enter__()
+        second_ctx.__enter__()
+        print("both")
+        first_ctx.__exit__(None, None, None)
+        print("second only")
+        second_ctx.__exit__(None, None, None)
+        print("neither")
+
+        assert sys.stdout is stdout
+        assert sys.stderr is stderr
+        with open(first_ctx._stdout_path) as f:
+            assert f.read() == "both\n"
+        with open(second_ctx._stdout_path) as f:
+            assert f.read() == "both\nsecond only\n"